@@ -104,10 +104,17 @@ class ApplicationContext:
             return
 
         self.config = config
-        validate_input_processor_config(config)
-        validate_output_processor_config(config)
-        self.input_processor_registry: Dict[str, Type[BaseInputProcessor]] = self._load_input_processor_registry()
-        self.output_processor_registry: Dict[str, Type[BaseInputProcessor]] = self._load_output_processor_registry()
+        # Processor classes are imported the first time their extension is requested,
+        # so contexts that never process documents do not load their libraries.
+        # Use validate_input_processor_config/validate_output_processor_config to check them upfront.
+        self._input_processor_paths: Dict[str, str] = {
+            entry.prefix.lower(): entry.class_path for entry in config.input_processors
+        }
+        self._output_processor_paths: Dict[str, str] = {
+            entry.prefix.lower(): entry.class_path for entry in (config.output_processors or [])
+        }
+        self.input_processor_registry: Dict[str, Type[BaseInputProcessor]] = {}
+        self.output_processor_registry: Dict[str, Type[BaseOutputProcessor]] = {}
         ApplicationContext._instance = self
         self._log_config_summary()
 
@@ -176,27 +183,13 @@ class ApplicationContext:
         """Reset the singleton instance (used in tests)."""
         cls._instance = None
 
-    def _load_input_processor_registry(self) -> Dict[str, Type[BaseInputProcessor]]:
-        registry = {}
-        for entry in self.config.input_processors:
-            cls = self._dynamic_import(entry.class_path)
-            if not issubclass(cls, BaseInputProcessor):
-                raise TypeError(f"{entry.class_path} is not a subclass of BaseProcessor")
-            logger.debug(f"Loaded input processor: {entry.class_path} for prefix: {entry.prefix}")
-            registry[entry.prefix.lower()] = cls
-        return registry
-    
-    def _load_output_processor_registry(self) -> Dict[str, Type[BaseOutputProcessor]]:
-        registry = {}
-        if not self.config.output_processors:
-            return registry
-        for entry in self.config.output_processors:
-            cls = self._dynamic_import(entry.class_path)
-            if not issubclass(cls, BaseOutputProcessor):
-                raise TypeError(f"{entry.class_path} is not a subclass of BaseOutputProcessor")
-            logger.debug(f"Loaded output processor: {entry.class_path} for prefix: {entry.prefix}")
-            registry[entry.prefix.lower()] = cls
-        return registry
+    def _load_processor_class(self, class_path: str, base_class: Type) -> Type:
+        """Import a configured processor class and check its base class."""
+        cls = self._dynamic_import(class_path)
+        if not issubclass(cls, base_class):
+            raise TypeError(f"{class_path} is not a subclass of {base_class.__name__}")
+        logger.debug(f"Loaded processor: {class_path}")
+        return cls
 
     def get_config(self) -> Configuration:
         return self.config
@@ -210,7 +203,13 @@ class ApplicationContext:
         Returns:
             Optional[Type[BaseInputProcessor]]: The input processor class, or None if not found.
         """
-        return self.input_processor_registry.get(extension.lower())
+        extension = extension.lower()
+        if extension not in self.input_processor_registry:
+            class_path = self._input_processor_paths.get(extension)
+            if class_path is None:
+                return None
+            self.input_processor_registry[extension] = self._load_processor_class(class_path, BaseInputProcessor)
+        return self.input_processor_registry[extension]
     
     def _get_output_processor_class(self, extension: str) -> Optional[Type[BaseOutputProcessor]]:
         """
@@ -221,7 +220,12 @@ class ApplicationContext:
         Returns:
             Optional[Type[BaseOutputProcessor]]: The output processor class, or None if not found.
         """
-        processor_class = self.output_processor_registry.get(extension.lower())
+        extension = extension.lower()
+        if extension not in self.output_processor_registry and extension in self._output_processor_paths:
+            self.output_processor_registry[extension] = self._load_processor_class(
+                self._output_processor_paths[extension], BaseOutputProcessor
+            )
+        processor_class = self.output_processor_registry.get(extension)
         if processor_class:
             return processor_class
 
@@ -398,23 +402,18 @@ class ApplicationContext:
         chat_profile_type = self.config.chat_profile_storage.type
         logger.info(f"  📁 Chat profile storage backend: {chat_profile_type}")
 
+        # Class names are taken from the configured paths so that nothing is imported here
         logger.info("  🧩 Input Processor Mappings:")
-        for ext, cls in self.input_processor_registry.items():
-            logger.info(f"    • {ext} → {cls.__name__}")
+        for ext, class_path in self._input_processor_paths.items():
+            logger.info(f"    • {ext} → {class_path.rsplit('.', 1)[-1]}")
 
         logger.info("  📤 Output Processor Mappings:")
         all_extensions = set(EXTENSION_CATEGORY.keys())
         for ext in sorted(all_extensions):
-            if ext in self.output_processor_registry:
-                cls = self.output_processor_registry[ext]
-            else:
-                category = EXTENSION_CATEGORY.get(ext)
-                default_path = DEFAULT_OUTPUT_PROCESSORS.get(category)
-                if default_path:
-                    cls = self._dynamic_import(default_path)
-                else:
-                    continue
-            logger.info(f"    • {ext} → {cls.__name__}")
+            class_path = self._output_processor_paths.get(ext) or DEFAULT_OUTPUT_PROCESSORS.get(EXTENSION_CATEGORY.get(ext))
+            if not class_path:
+                continue
+            logger.info(f"    • {ext} → {class_path.rsplit('.', 1)[-1]}")
 
         logger.info("--------------------------------------------------")
 
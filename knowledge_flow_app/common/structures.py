@@ -65,7 +65,7 @@ class ContentStorageConfig(BaseModel):
     type: str = Field(..., description="The storage backend to use (e.g., 'local', 'minio')")
 
 class MetadataStorageConfig(BaseModel):
-    type: str = Field(..., description="The storage backend to use (e.g., 'local', 'opensearch')")
+    type: str = Field(..., description="The storage backend to use (e.g., 'local', 'sqlite', 'opensearch')")
 
 class VectorStorageConfig(BaseModel):
     type: str = Field(..., description="The vector backend to use (e.g., 'opensearch', 'chromadb')")
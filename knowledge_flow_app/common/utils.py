@@ -12,15 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import logging
+import os
+import socket
+from functools import lru_cache
+import certifi
+import orjson
+import urllib3
+from urllib3.connection import HTTPConnection
 from pydantic import ValidationError
 from pydantic_settings import BaseSettings
 import yaml
-from typing import Dict
+from typing import Any, Callable, Dict, Optional, Union
 
 from knowledge_flow_app.common.structures import Configuration
 logger = logging.getLogger(__name__)
 
+# Connections kept per MinIO host by the shared pool. The minio default keeps at most 10,
+# fewer than the concurrent requests issued by the MinIO stores.
+MINIO_HTTP_POOL_MAXSIZE = 64
+
 def parse_server_configuration(configuration_path: str) -> Configuration:
     """
     Parses the server configuration from a YAML file.
@@ -40,6 +52,22 @@ def parse_server_configuration(configuration_path: str) -> Configuration:
     return Configuration(**config)
 
 
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses JSON with orjson, which reads bytes directly (no decode step) and is several
+    times faster than the json module. Invalid input raises a ValueError subclass.
+    """
+    return orjson.loads(data)
+
+
+def json_dumps(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serializes to compact UTF-8 JSON bytes with orjson. `default` converts values orjson
+    does not support natively; unsupported values raise a TypeError subclass.
+    """
+    return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
 def get_embedding_model_name(embedding_model: object) -> str:
     """
     Returns a clean string name for the embedding model, even if wrapped inside a custom class.
@@ -60,4 +88,55 @@ def validate_settings_or_exit(cls: type[BaseSettings], name: str = "Settings") -
             msg = error.get("msg", "")
             logger.critical(f"   - Missing or invalid: {field} → {msg}")
         logger.critical("📌 Tip: Check your .env file or environment variables.")
-        raise SystemExit(1)
\ No newline at end of file
+        raise SystemExit(1)
+
+
+class ReleasingStream(io.RawIOBase):
+    """
+    Read-only BinaryIO over a streaming HTTP response (e.g. the urllib3 response returned
+    by MinIO's get_object). Data is pulled from the socket as the caller reads, and closing
+    the stream releases the connection back to the client pool, as required by the MinIO SDK.
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._response.read(None if size is None or size < 0 else size)
+
+    def readall(self) -> bytes:
+        return self._response.read()
+
+    def readinto(self, buffer) -> int:
+        return self._response.readinto(buffer)
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._response.close()
+                self._response.release_conn()
+            finally:
+                super().close()
+
+
+@lru_cache(maxsize=1)
+def get_minio_http_client() -> urllib3.PoolManager:
+    """
+    Connection pool shared by every MinIO client of the process, sized for the stores'
+    concurrent uploads and downloads. The CA bundle, timeouts and retried statuses
+    mirror the minio defaults.
+    """
+    return urllib3.PoolManager(
+        num_pools=4,
+        maxsize=MINIO_HTTP_POOL_MAXSIZE,
+        block=False,
+        timeout=urllib3.Timeout(connect=300, read=300),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504]),
+        # default options already set TCP_NODELAY; keep idle pooled connections alive
+        socket_options=HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+    )
@@ -31,6 +31,7 @@ class OpenSearchSettings(BaseSettings):
         opensearch_secure (bool): Whether to use HTTPS for the connection.
         opensearch_vector_index (str): The name of the vector index in OpenSearch.
         opensearch_metadata_index (str): The name of the metadata index in OpenSearch.
+        opensearch_pool_maxsize (int): The number of connections kept open per OpenSearch node.
     """
     opensearch_host: str = Field(..., validation_alias="OPENSEARCH_HOST")
     opensearch_user: str = Field(..., validation_alias="OPENSEARCH_USER")
@@ -39,6 +40,7 @@ class OpenSearchSettings(BaseSettings):
     opensearch_vector_index: str = Field(..., validation_alias="OPENSEARCH_VECTOR_INDEX")
     opensearch_metadata_index: str = Field(..., validation_alias="OPENSEARCH_METADATA_INDEX")
     opensearch_verify_certs: bool = Field(False, validation_alias="OPENSEARCH_VERIFY_CERTS")
+    opensearch_pool_maxsize: int = Field(32, validation_alias="OPENSEARCH_POOL_MAXSIZE")
     model_config = {
         "extra": "ignore" # allows unrelated variables in .env or os.environ
     }
\ No newline at end of file
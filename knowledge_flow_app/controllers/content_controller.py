@@ -13,13 +13,24 @@
 # limitations under the License.
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterator, List
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _iter_stream(stream: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yields fixed-size chunks from a binary stream and closes it once exhausted
+    (or when the client disconnects), so the content store can release its resources.
+    """
+    with stream:
+        while chunk := stream.read(chunk_size):
+            yield chunk
+
 # --- Response Models ---
 class DocumentContent(BaseModel):
     """
@@ -93,7 +104,7 @@ class ContentController:
                 stream, file_name, content_type = await self.service.get_original_content(document_uid)
 
                 return StreamingResponse(
-                    content=stream,
+                    content=_iter_stream(stream),
                     media_type=content_type,
                     headers={
                         "Content-Disposition": f'attachment; filename="{file_name}"'
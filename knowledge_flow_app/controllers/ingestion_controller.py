@@ -115,7 +115,7 @@ class IngestionController:
 
                         # check if metadata is already known if so delete it to replace it and process the
                         # document again
-                        if self.metadata_store.get_metadata_by_uid(metadata["document_uid"]):
+                        if self.metadata_store.uid_exists(metadata["document_uid"]):
                             logger.info(f"Metadata already exists for {filename}: {metadata}")
                             self.metadata_store.delete_metadata(metadata)
                             self.content_store.delete_content(metadata["document_uid"])
@@ -30,7 +30,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi_mcp import FastApiMCP
 from rich.logging import RichHandler
 
-from knowledge_flow_app.application_context import ApplicationContext
+from knowledge_flow_app.application_context import (
+    ApplicationContext,
+    validate_input_processor_config,
+    validate_output_processor_config,
+)
 from knowledge_flow_app.common.structures import Configuration
 from knowledge_flow_app.common.utils import parse_server_configuration
 from knowledge_flow_app.controllers.chat_profile_controller import ChatProfileController
@@ -67,6 +71,9 @@ logger = logging.getLogger(__name__)
 def create_app(config_path: str = "./config/configuration.yaml", base_url: str = "/knowledge/v1") -> FastAPI:
     logger.info(f"🛠️ create_app() called with base_url={base_url}")
     configuration: Configuration = parse_server_configuration(config_path)
+    # Fail fast on misconfigured processors; the context only imports them on first use
+    validate_input_processor_config(configuration)
+    validate_output_processor_config(configuration)
     ApplicationContext(configuration)
 
     app = FastAPI(
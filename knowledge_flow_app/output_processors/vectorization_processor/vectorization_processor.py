@@ -95,7 +95,7 @@ class VectorizationProcessor(BaseOutputProcessor):
             if document_uid is None:
                 raise ValueError("Metadata must contain a 'document_uid'.")
 
-            if self.metadata_store.get_metadata_by_uid(document_uid):
+            if self.metadata_store.uid_exists(document_uid):
                 logger.info(f"Document with UID {document_uid} already exists. Skipping.")
                 return VectorizationResponse(
                     status=Status.IGNORED,
@@ -160,10 +160,9 @@ class ChatProfileService:
             profile_data = self.store.get_profile_description(profile_id)
 
             markdown = ""
-            if hasattr(self.store, "list_markdown_files"):
-                md_files = self.store.list_markdown_files(profile_id)
-                for filename, content in md_files:
-                    markdown += f"\n\n# {filename}\n\n{content}"
+            md_files = self.store.list_markdown_files(profile_id)
+            for filename, content in md_files:
+                markdown += f"\n\n# {filename}\n\n{content}"
 
             return {
                 "id": profile_data["id"],
@@ -297,11 +296,10 @@ class ChatProfileService:
             metadata["tokens"] = total_tokens
 
             # Delete markdown files
-            if hasattr(self.store, "delete_markdown_file"):
-                try:
-                    self.store.delete_markdown_file(profile_id, document_id)
-                except Exception as e:
-                    logger.warning(f"Failed to delete markdown file for {document_id}: {e}")
+            try:
+                self.store.delete_markdown_file(profile_id, document_id)
+            except Exception as e:
+                logger.warning(f"Failed to delete markdown file for {document_id}: {e}")
 
             # Recreate profile directory
             with tempfile.TemporaryDirectory() as tmp_dir:
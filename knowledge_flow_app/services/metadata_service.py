@@ -36,7 +36,7 @@ class MetadataService:
         Retrieves documents metadata based on the provided filters.
         The filters_dict can contain various keys to filter the documents.
         """
-        documents = self.metadata_store.get_all_metadata(filters_dict)
+        documents = list(self.metadata_store.get_all_metadata(filters_dict))
         logger.info(f"Documents metadata retrieved fore {filters_dict} : {documents}")
         return {"status": Status.SUCCESS, "documents": documents}
 
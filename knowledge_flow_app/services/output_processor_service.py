@@ -53,21 +53,14 @@ class OutputProcessorService:
             raise ValueError(f"Output directory {output_dir} does not exist")
         if not output_dir.is_dir():
             raise ValueError(f"Output directory {output_dir} is not a directory")
-        # check if the output_dir contains "output.md" or "output.csv" files
-        if not any(output_dir.glob("*.*")):
+        # get the first output file ('output.md' or 'output.csv') of the output_dir
+        output_file = next(output_dir.glob("*.*"), None)
+        if output_file is None:
             raise ValueError(f"Output directory {output_dir} does not contain output files")
-        # get the first file in the output_dir
-        output_file = next(output_dir.glob("*.*"))
-        # check if the file is a markdown or csv file
-        if output_file.suffix.lower() not in [".md", ".csv"]:
-            raise ValueError(f"Output file {output_file} is not a markdown or csv file")
+        # only markdown outputs are handed over to the output processor
+        if not output_file.name.lower().endswith((".md", ".markdown")):
+            raise ValueError(f"Output file {output_file} is not a markdown file")
         # check if the file is empty
         if output_file.stat().st_size == 0:
             raise ValueError(f"Output file {output_file} is empty")
-        # check if the file is a markdown or csv file
-        if output_file.suffix.lower() == ".md" or output_file.suffix.lower() == ".markdown":
-            # check if the file is a markdown file
-            return processor.process(output_file, input_file_metadata)
-        else:
-            raise ValueError(f"Output file {output_file} is not a markdown or csv file")
-        
\ No newline at end of file
+        return processor.process(output_file, input_file_metadata)
@@ -28,6 +28,7 @@ class BaseChatProfileStore(ABC):
     def get_document(self, profile_id: str, document_name: str) -> BinaryIO:
         """
         Fetch a specific markdown document related to the profile.
+        The returned stream must be closed by the caller (e.g. with a `with` block).
         """
         pass
     
@@ -40,4 +41,11 @@ class BaseChatProfileStore(ABC):
 
     @abstractmethod
     def list_profiles(self) -> List[dict]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def delete_markdown_file(self, profile_id: str, document_id: str) -> None:
+        """
+        Delete the markdown file of a single document from the profile.
+        """
+        pass
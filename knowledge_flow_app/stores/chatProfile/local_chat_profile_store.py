@@ -1,51 +1,89 @@
-import json
 import logging
+import os
 import shutil
+import threading
 from pathlib import Path
 from typing import BinaryIO, List
+from cachetools import LRUCache
+from knowledge_flow_app.common.utils import json_loads
 from .base_chat_profile_store import BaseChatProfileStore
 logger = logging.getLogger(__name__)
 
+# The markdown cache is bounded by the total number of cached characters
+MARKDOWN_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    copytree copy function that hardlinks files when source and destination share a
+    filesystem (a metadata-only operation) and falls back to a regular copy otherwise.
+    """
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        return shutil.copy2(src, dst)
 
 class LocalChatProfileStore(BaseChatProfileStore):
     def __init__(self, root_path: Path):
         self.root_path = root_path
+        # (profile_id, markdown filename) -> (st_mtime_ns, content), least recently used evicted first
+        self._md_cache_lock = threading.Lock()
+        self._md_cache: LRUCache = LRUCache(maxsize=MARKDOWN_CACHE_MAX_CHARS, getsizeof=lambda entry: len(entry[1]))
+
+    def _forget_markdown(self, profile_id: str) -> None:
+        with self._md_cache_lock:
+            for key in [key for key in self._md_cache if key[0] == profile_id]:
+                del self._md_cache[key]
+
+    def _load_profile_json(self, profile_path: str) -> dict:
+        """
+        Returns the parsed profile.json. The file is small and parsed straight from bytes,
+        which is cheaper than stat-ing it and copying a cached description.
+        """
+        with open(profile_path, "rb") as f:
+            return json_loads(f.read())
 
     def save_profile(self, profile_id: str, directory: Path) -> None:
         destination = self.root_path / profile_id
         if destination.exists():
             shutil.rmtree(destination)
-        shutil.copytree(directory, destination)
+        shutil.copytree(directory, destination, copy_function=_fast_copy)
+        # copytree preserves source mtimes, so do not rely on them to detect the overwrite
+        self._forget_markdown(profile_id)
 
     def delete_profile(self, profile_id: str) -> None:
         profile_dir = self.root_path / profile_id
         if profile_dir.exists():
             shutil.rmtree(profile_dir)
+        self._forget_markdown(profile_id)
 
     def get_profile_description(self, profile_id: str) -> dict:
         desc_path = self.root_path / profile_id / "profile.json"
-        if not desc_path.exists():
+        try:
+            return self._load_profile_json(str(desc_path))
+        except FileNotFoundError:
             raise FileNotFoundError("Chat profile description not found")
-        return json.loads(desc_path.read_text(encoding="utf-8"))
 
     def get_document(self, profile_id: str, document_name: str) -> BinaryIO:
         doc_path = self.root_path / profile_id / "files" / document_name
-        if not doc_path.exists():
+        try:
+            return open(doc_path, "rb")
+        except FileNotFoundError:
             raise FileNotFoundError("Document not found in chat profile")
-        return open(doc_path, "rb")
     
     def list_profiles(self) -> List[dict]:
         profiles = []
-        for dir_path in self.root_path.iterdir():
-            if dir_path.is_dir():
-                profile_path = dir_path / "profile.json"
-                if profile_path.exists():
-                    try:
-                        with open(profile_path, encoding="utf-8") as f:
-                            profile_data = json.load(f)
-                            profiles.append(profile_data)
-                    except Exception as e:
-                        logger.error(f"Failed to load profile at {profile_path}: {e}", exc_info=True)
+        with os.scandir(self.root_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                profile_path = os.path.join(entry.path, "profile.json")
+                try:
+                    profiles.append(self._load_profile_json(profile_path))
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    logger.error(f"Failed to load profile at {profile_path}: {e}", exc_info=True)
         return profiles
 
 
@@ -55,15 +93,32 @@ class LocalChatProfileStore(BaseChatProfileStore):
         """
         result = []
         files_path = self.root_path / profile_id / "files"
-        if not files_path.exists():
+        try:
+            entries = os.scandir(files_path)
+        except FileNotFoundError:
             return result
 
-        for file_path in files_path.glob("*.md"):
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                result.append((file_path.name, content))
-            except Exception as e:
-                logger.error(f"Failed to read markdown file {file_path}: {e}", exc_info=True)
+        # File contents are memoized and only re-read when their mtime changes
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                try:
+                    key = (profile_id, entry.name)
+                    mtime_ns = entry.stat().st_mtime_ns
+                    with self._md_cache_lock:
+                        cached = self._md_cache.get(key)
+                    if cached is None or cached[0] != mtime_ns:
+                        with open(entry.path, "rb") as f:
+                            cached = (mtime_ns, f.read().decode("utf-8"))
+                        with self._md_cache_lock:
+                            try:
+                                self._md_cache[key] = cached
+                            except ValueError:
+                                pass  # larger than the whole cache: served without caching
+                    result.append((entry.name, cached[1]))
+                except Exception as e:
+                    logger.error(f"Failed to read markdown file {entry.path}: {e}", exc_info=True)
 
         return result
 
@@ -71,3 +126,5 @@ class LocalChatProfileStore(BaseChatProfileStore):
         file_path = self.root_path / profile_id / "files" / f"{document_id}.md"
         if file_path.exists():
             file_path.unlink()
+        with self._md_cache_lock:
+            self._md_cache.pop((profile_id, file_path.name), None)
@@ -1,16 +1,26 @@
-import json
 import logging
-from io import BytesIO
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import BinaryIO, List
 
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 
+from knowledge_flow_app.common.utils import ReleasingStream, get_minio_http_client, json_loads
 from .base_chat_profile_store import BaseChatProfileStore
 
 logger = logging.getLogger(__name__)
 
+# Number of concurrent MinIO requests issued when a profile spans several objects,
+# kept within the shared connection pool (see get_minio_http_client).
+MAX_WORKERS = 16
+# Files above this size are uploaded as multipart with an explicit part size.
+MULTIPART_THRESHOLD = 5 * 1024 * 1024
+PART_SIZE = 8 * 1024 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+
 class MinioChatProfileStore(BaseChatProfileStore):
     def __init__(self, endpoint: str, access_key: str, secret_key: str, bucket_name: str, secure: bool):
         self.bucket_name = bucket_name
@@ -18,7 +28,8 @@ class MinioChatProfileStore(BaseChatProfileStore):
             endpoint,
             access_key=access_key,
             secret_key=secret_key,
-            secure=secure
+            secure=secure,
+            http_client=get_minio_http_client()
         )
 
         if not self.client.bucket_exists(bucket_name):
@@ -29,41 +40,62 @@ class MinioChatProfileStore(BaseChatProfileStore):
         """
         Uploads the entire chat profile folder (including profile.json and files/) to MinIO.
         """
+        uploads = []
         for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                object_name = f"{profile_id}/{file_path.relative_to(directory)}"
-                try:
-                    self.client.fput_object(
-                        self.bucket_name,
-                        object_name,
-                        str(file_path)
-                    )
-                    logger.info(f"Uploaded '{object_name}' to bucket '{self.bucket_name}'.")
-                except S3Error as e:
-                    logger.error(f"Failed to upload '{file_path}': {e}")
-                    raise ValueError(f"Failed to upload '{file_path}': {e}")
+            # A single stat gives both the file type and the upload length
+            file_stat = file_path.stat()
+            if stat.S_ISREG(file_stat.st_mode):
+                object_name = f"{profile_id}/{file_path.relative_to(directory).as_posix()}"
+                uploads.append((object_name, file_path, file_stat.st_size))
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(lambda upload: self._upload_file(*upload), uploads))
+
+    def _upload_file(self, object_name: str, file_path: Path, size: int) -> None:
+        part_size = PART_SIZE if size > MULTIPART_THRESHOLD else 0
+        try:
+            with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as data:
+                self.client.put_object(
+                    self.bucket_name,
+                    object_name,
+                    data,
+                    length=size,
+                    part_size=part_size
+                )
+            logger.info(f"Uploaded '{object_name}' to bucket '{self.bucket_name}'.")
+        except S3Error as e:
+            logger.error(f"Failed to upload '{file_path}': {e}")
+            raise ValueError(f"Failed to upload '{file_path}': {e}")
 
     def delete_profile(self, profile_id: str) -> None:
         """
         Deletes all files under a chat profile ID from the bucket.
+        Objects are removed with the bulk DeleteObjects API (up to 1000 keys per request).
         """
         try:
-            objects_to_delete = self.client.list_objects(self.bucket_name, prefix=f"{profile_id}/", recursive=True)
-            for obj in objects_to_delete:
-                self.client.remove_object(self.bucket_name, obj.object_name)
-                logger.info(f"Deleted '{obj.object_name}' from bucket '{self.bucket_name}'.")
+            objects_to_delete = [
+                DeleteObject(obj.object_name)
+                for obj in self.client.list_objects(self.bucket_name, prefix=f"{profile_id}/", recursive=True)
+            ]
+            # remove_objects is lazy: errors are only reported once the iterator is drained
+            errors = list(self.client.remove_objects(self.bucket_name, objects_to_delete))
         except S3Error as e:
             logger.error(f"Failed to delete profile {profile_id}: {e}")
             raise ValueError(f"Failed to delete chat profile from MinIO: {e}")
 
+        if errors:
+            for error in errors:
+                logger.error(f"Failed to delete '{error.name}' for profile {profile_id}: {error}")
+            raise ValueError(f"Failed to delete chat profile from MinIO: {len(errors)} object(s) could not be removed")
+        logger.info(f"Deleted {len(objects_to_delete)} object(s) for profile '{profile_id}' from bucket '{self.bucket_name}'.")
+
     def get_profile_description(self, profile_id: str) -> dict:
         """
         Retrieves the profile.json metadata from MinIO.
         """
         object_name = f"{profile_id}/profile.json"
         try:
-            response = self.client.get_object(self.bucket_name, object_name)
-            return json.loads(response.read().decode("utf-8"))
+            return json_loads(self._read_object(object_name))
         except S3Error as e:
             logger.error(f"Failed to fetch profile.json for {profile_id}: {e}")
             raise FileNotFoundError(f"Metadata not found for chat profile: {profile_id}")
@@ -71,28 +103,41 @@ class MinioChatProfileStore(BaseChatProfileStore):
     def get_document(self, profile_id: str, document_name: str) -> BinaryIO:
         """
         Fetches a single markdown document from the files/ folder inside a profile.
+        The document is streamed from MinIO: the caller must close the returned stream
+        to release the underlying connection.
         """
         object_name = f"{profile_id}/files/{document_name}"
         try:
-            response = self.client.get_object(self.bucket_name, object_name)
-            return BytesIO(response.read())
+            return ReleasingStream(self.client.get_object(self.bucket_name, object_name))
         except S3Error as e:
             logger.error(f"Failed to fetch document '{document_name}' for {profile_id}: {e}")
             raise FileNotFoundError(f"Document '{document_name}' not found in chat profile: {profile_id}")
 
+    def _read_object(self, object_name: str) -> bytes:
+        response = self.client.get_object(self.bucket_name, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
     def list_markdown_files(self, profile_id: str) -> list[tuple[str, str]]:
-        result = []
         prefix = f"{profile_id}/files/"
         try:
-            for obj in self.client.list_objects(self.bucket_name, prefix=prefix, recursive=True):
-                if obj.object_name.endswith(".md"):
-                    response = self.client.get_object(self.bucket_name, obj.object_name)
-                    content = response.read().decode("utf-8")
-                    filename = obj.object_name.split("/")[-1]
-                    result.append((filename, content))
+            object_names = [
+                obj.object_name
+                for obj in self.client.list_objects(self.bucket_name, prefix=prefix, recursive=True)
+                if obj.object_name.endswith(".md")
+            ]
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                contents = list(executor.map(self._read_object, object_names))
         except S3Error as e:
             logger.error(f"Error listing markdowns for profile {profile_id}: {e}")
-        return result
+            return []
+        return [
+            (object_name.split("/")[-1], content.decode("utf-8"))
+            for object_name, content in zip(object_names, contents)
+        ]
 
 
     def list_profiles(self) -> List[dict]:
@@ -103,26 +148,39 @@ class MinioChatProfileStore(BaseChatProfileStore):
         profiles = []
 
         try:
-            # Récupère les objets profile.json à la racine de chaque dossier de profil
-            objects = self.client.list_objects(self.bucket_name, recursive=True)
+            # Liste non récursive : le serveur ne renvoie que les dossiers de profil de premier niveau
+            # (CommonPrefixes), sans parcourir les fichiers files/*.md de chaque profil
+            objects = self.client.list_objects(self.bucket_name, prefix="", recursive=False)
 
             profile_json_paths = [
-                obj.object_name for obj in objects
-                if obj.object_name.endswith("profile.json") and obj.object_name.count("/") == 1
+                f"{obj.object_name}profile.json" for obj in objects
+                if obj.is_dir
             ]
 
-            for obj_path in profile_json_paths:
-                try:
-                    response = self.client.get_object(self.bucket_name, obj_path)
-                    profile_data = json.loads(response.read().decode("utf-8"))
-                    profiles.append(profile_data)
-                except Exception as e:
-                    logger.error(f"Erreur lors de la lecture de {obj_path} : {e}", exc_info=True)
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                profiles = [
+                    profile_data
+                    for profile_data in executor.map(self._load_profile_json, profile_json_paths)
+                    if profile_data is not None
+                ]
 
         except Exception as e:
             logger.error(f"Erreur lors de la liste des profils MinIO : {e}", exc_info=True)
 
         return profiles
+
+    def _load_profile_json(self, obj_path: str) -> dict | None:
+        try:
+            return json_loads(self._read_object(obj_path))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                logger.debug(f"No profile.json found at {obj_path}, skipping.")
+                return None
+            logger.error(f"Erreur lors de la lecture de {obj_path} : {e}", exc_info=True)
+            return None
+        except Exception as e:
+            logger.error(f"Erreur lors de la lecture de {obj_path} : {e}", exc_info=True)
+            return None
     
     def delete_markdown_file(self, profile_id: str, document_id: str) -> None:
         key = f"{profile_id}/files/{document_id}.md"
@@ -41,7 +41,9 @@ class BaseContentStore(ABC):
         Retrieve a readable binary stream for the document's primary content.
 
         Returns:
-            BinaryIO: A file-like object you can stream from.
+            BinaryIO: A file-like object you can stream from. The caller owns the
+            stream and must close it (e.g. with a `with` block) to release the
+            underlying file handle or connection.
 
         Raises:
             FileNotFoundError: If the document is not found.
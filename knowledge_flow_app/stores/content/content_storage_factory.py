@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 from knowledge_flow_app.application_context import ApplicationContext
 from knowledge_flow_app.common.utils import validate_settings_or_exit
 from knowledge_flow_app.config.content_store_local_settings import ContentStoreLocalSettings
@@ -19,14 +21,39 @@ from knowledge_flow_app.config.content_store_minio_settings import ContentStoreM
 from pathlib import Path
 
 from knowledge_flow_app.stores.content.base_content_store import BaseContentStore
-from knowledge_flow_app.stores.content.local_content_store import LocalStorageBackend
-from knowledge_flow_app.stores.content.minio_content_store import MinioContentStore
 
 
-        
+
+def _make_minio() -> BaseContentStore:
+    from knowledge_flow_app.stores.content.minio_content_store import MinioContentStore
+    settings = validate_settings_or_exit(ContentStoreMinioSettings, "MinIO Settings")
+    return MinioContentStore(
+        endpoint=settings.minio_endpoint,
+        access_key=settings.minio_access_key,
+        secret_key=settings.minio_secret_key,
+        bucket_name=settings.minio_bucket_name,
+        secure=settings.minio_secure
+    )
+
+
+def _make_local() -> BaseContentStore:
+    from knowledge_flow_app.stores.content.local_content_store import LocalStorageBackend
+    settings = ContentStoreLocalSettings()
+    return LocalStorageBackend(Path(settings.root_path).expanduser())
+
+
+# Backend builders import their module on demand so unused client libraries are never loaded
+_BACKENDS = {
+    "minio": _make_minio,
+    "local": _make_local,
+}
+
+
+@lru_cache(maxsize=1)
 def get_content_store() -> BaseContentStore:
     """
     Factory function to get the appropriate storage backend based on configuration.
+    The backend is created once and shared; see clear_content_store_cache().
     Returns:
         StorageBackend: An instance of the storage backend.
     """
@@ -34,17 +61,14 @@ def get_content_store() -> BaseContentStore:
     config = ApplicationContext.get_instance().get_config()
     backend_type = config.content_storage.type
 
-    if backend_type == "minio":
-        settings = validate_settings_or_exit(ContentStoreMinioSettings, "MinIO Settings")
-        return MinioContentStore(
-            endpoint=settings.minio_endpoint,
-            access_key=settings.minio_access_key,
-            secret_key=settings.minio_secret_key,
-            bucket_name=settings.minio_bucket_name,
-            secure=settings.minio_secure
-        )
-    elif backend_type == "local":
-        settings = ContentStoreLocalSettings()
-        return LocalStorageBackend(Path(settings.root_path).expanduser())
-    else:
+    make_backend = _BACKENDS.get(backend_type)
+    if make_backend is None:
         raise ValueError(f"Unsupported storage backend: {backend_type}")
+    return make_backend()
+
+
+def clear_content_store_cache() -> None:
+    """
+    Forget the shared content store, e.g. after the configuration changed in tests.
+    """
+    get_content_store.cache_clear()
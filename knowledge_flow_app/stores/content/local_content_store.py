@@ -12,41 +12,125 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import errno
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import BinaryIO
 
 from knowledge_flow_app.stores.content.base_content_store import BaseContentStore
 logger = logging.getLogger(__name__)
 
+# Copies are I/O bound, so more threads than cores keeps the disk busy
+MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# copy_file_range errors meaning "not possible here", e.g. across filesystems
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """
+    shutil.copy2 replacement copying data in the kernel with os.copy_file_range,
+    which reflinks on btrfs/XFS. Falls back to shutil.copy2 where it is not available,
+    or when it stops early (some FUSE/overlay/NFS mounts report 0 bytes copied).
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError as e:
+        if e.errno not in _COPY_RANGE_UNSUPPORTED:
+            raise
+        return shutil.copy2(src, dst)
+    if remaining > 0:
+        # Truncated copy: redo it in user space rather than keep a partial file
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 class LocalStorageBackend(BaseContentStore):
     def __init__(self, destination_root: Path):
         self.destination_root = destination_root
 
     def save_content(self, document_uid: str, document_dir: Path) -> None:
+        """
+        Mirrors the document directory into the store. When the document was already
+        saved, only new or modified files are copied and stale ones are removed,
+        so re-processing an unchanged document costs a directory walk, not a full copy.
+        """
         destination = self.destination_root / document_uid
 
-        # 🧹 1. Clean old destination if it exists
-        if destination.exists():
-            shutil.rmtree(destination)
-
-        # 🏗️ 2. Create destination
+        # 🏗️ 1. Create destination
         destination.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"📂 Created destination folder: {destination}")
+        # 🔍 2. Compare source and destination, removing stale entries
+        copies: list[tuple[Path, Path]] = []
+        self._mirror(document_dir, destination, copies)
 
-        # 📦 3. Copy all contents
-        for item in document_dir.iterdir():
-            target = destination / item.name
-            if item.is_dir():
-                shutil.copytree(item, target)
-                logger.info(f"📁 Copied directory: {item} -> {target}")
+        # 📦 3. Copy new or modified items, one item per worker
+        with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+            futures = [executor.submit(self._copy_item, item, target) for item, target in copies]
+            for future in futures:
+                future.result()  # propagate copy errors
+
+        logger.info(f"✅ Successfully saved document {document_uid} to {destination} ({len(copies)} item(s) copied)")
+
+    def _mirror(self, src: Path, dst: Path, copies: list[tuple[Path, Path]]) -> None:
+        """
+        rsync-style comparison of src against an existing dst directory. Entries of dst
+        missing from src are deleted right away; the (source, target) pairs that need
+        copying are appended to `copies`. Files are considered unchanged when size and
+        mtime match, which holds for files previously copied with copy2.
+        """
+        with os.scandir(src) as entries:
+            src_entries = {entry.name: entry for entry in entries}
+        with os.scandir(dst) as entries:
+            dst_entries = {entry.name: entry for entry in entries}
+
+        for name, dst_entry in dst_entries.items():
+            src_entry = src_entries.get(name)
+            if src_entry is None or src_entry.is_dir() != dst_entry.is_dir(follow_symlinks=False):
+                self._remove_entry(dst_entry)
+                dst_entries[name] = None
+                logger.debug(f"🧹 Removed stale entry: {dst_entry.path}")
+
+        for name, src_entry in src_entries.items():
+            dst_entry = dst_entries.get(name)
+            target = dst / name
+            if dst_entry is None:
+                copies.append((Path(src_entry.path), target))
+            elif src_entry.is_dir():
+                self._mirror(Path(src_entry.path), target, copies)
             else:
-                shutil.copy2(item, target)
-                logger.info(f"📄 Copied file: {item} -> {target}")
+                src_stat = src_entry.stat()
+                dst_stat = dst_entry.stat(follow_symlinks=False)
+                if src_stat.st_size != dst_stat.st_size or src_stat.st_mtime_ns != dst_stat.st_mtime_ns:
+                    copies.append((Path(src_entry.path), target))
+
+    @staticmethod
+    def _remove_entry(entry: os.DirEntry) -> None:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
 
-        logger.info(f"✅ Successfully saved document {document_uid} to {destination}")
+    @staticmethod
+    def _copy_item(item: Path, target: Path) -> None:
+        if item.is_dir():
+            shutil.copytree(item, target, copy_function=_copy_file)
+            logger.debug(f"📁 Copied directory: {item} -> {target}")
+        else:
+            _copy_file(item, target)
+            logger.debug(f"📄 Copied file: {item} -> {target}")
 
     def delete_content(self, document_uid: str) -> None:
         """
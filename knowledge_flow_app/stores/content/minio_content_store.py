@@ -12,16 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from io import BytesIO
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 import logging
+import threading
 from pathlib import Path
 from typing import BinaryIO
+from cachetools import TTLCache
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from knowledge_flow_app.common.utils import ReleasingStream, get_minio_http_client
 from knowledge_flow_app.stores.content.base_content_store import BaseContentStore
 
 logger = logging.getLogger(__name__)
 
+# Number of concurrent uploads issued by save_content
+MAX_UPLOAD_WORKERS = 16
+# Lookups are cached per process; other replicas' writes become visible after the TTL
+CACHE_TTL_SECONDS = 300
+INPUT_OBJECT_CACHE_SIZE = 1024
+# The markdown cache is bounded by the total number of cached characters
+MARKDOWN_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+# (endpoint, bucket) pairs already checked by this process
+_checked_buckets: set[tuple[str, str]] = set()
+_checked_buckets_lock = threading.Lock()
+
 class MinioContentStore(BaseContentStore):
     """
     MinIO content store for uploading files to a MinIO bucket.
@@ -32,67 +48,98 @@ class MinioContentStore(BaseContentStore):
         Initializes the MinIO client and ensures the bucket exists.
         """
         self.bucket_name = bucket_name
-        self.client = Minio(endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
+        self.client = Minio(endpoint, access_key=access_key, secret_key=secret_key, secure=secure, http_client=get_minio_http_client())
+
+        # document_uid -> name of its input object, and document_uid -> markdown content
+        self._cache_lock = threading.Lock()
+        self._input_object_cache = TTLCache(maxsize=INPUT_OBJECT_CACHE_SIZE, ttl=CACHE_TTL_SECONDS)
+        self._markdown_cache = TTLCache(maxsize=MARKDOWN_CACHE_MAX_CHARS, ttl=CACHE_TTL_SECONDS, getsizeof=len)
 
-        # Ensure bucket exists or create it
-        if not self.client.bucket_exists(bucket_name):
-            self.client.make_bucket(bucket_name)
-            logger.info(f"Bucket '{bucket_name}' created successfully.")
+        self._ensure_bucket(endpoint)
+
+    def _ensure_bucket(self, endpoint: str) -> None:
+        """
+        Creates the bucket if it does not exist. The round-trip is done once per process
+        and bucket, not each time a store is created.
+        """
+        key = (endpoint, self.bucket_name)
+        with _checked_buckets_lock:
+            if key in _checked_buckets:
+                return
+            if not self.client.bucket_exists(self.bucket_name):
+                self.client.make_bucket(self.bucket_name)
+                logger.info(f"Bucket '{self.bucket_name}' created successfully.")
+            _checked_buckets.add(key)
 
     def save_content(self, document_uid: str, document_dir: Path):
         """
         Uploads all files in the given directory to MinIO,
         preserving the document UID as the root prefix.
         """
-        for file_path in document_dir.rglob("*"):
-            if file_path.is_file():
-                object_name = f"{document_uid}/{file_path.relative_to(document_dir)}"
-                try:
-                    self.client.fput_object(
-                        self.bucket_name,
-                        object_name,
-                        str(file_path)
-                    )
-                    logger.info(f"Uploaded '{object_name}' to bucket '{self.bucket_name}'.")
-                except S3Error as e:
-                    logger.error(f"Failed to upload '{file_path}': {e}")
-                    raise ValueError(f"Failed to upload '{file_path}': {e}")
-                
+        self._invalidate_cache(document_uid)
+        files = [file_path for file_path in document_dir.rglob("*") if file_path.is_file()]
+
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(self._upload_file, f"{document_uid}/{file_path.relative_to(document_dir).as_posix()}", file_path)
+                for file_path in files
+            ]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            # Fail fast: do not start the remaining uploads once one of them failed
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
+
+    def _upload_file(self, object_name: str, file_path: Path) -> None:
+        try:
+            self.client.fput_object(
+                self.bucket_name,
+                object_name,
+                str(file_path)
+            )
+            logger.info(f"Uploaded '{object_name}' to bucket '{self.bucket_name}'.")
+        except S3Error as e:
+            logger.error(f"Failed to upload '{file_path}': {e}")
+            raise ValueError(f"Failed to upload '{file_path}': {e}")
 
     def delete_content(self, document_uid: str) -> None:
         """
         Deletes all objects in the bucket under the given document UID prefix.
+        Objects are removed with the bulk DeleteObjects API (up to 1000 keys per request).
         """
+        self._invalidate_cache(document_uid)
         try:
-            objects_to_delete = self.client.list_objects(self.bucket_name, prefix=f"{document_uid}/", recursive=True)
-            deleted_any = False
-
-            for obj in objects_to_delete:
-                self.client.remove_object(self.bucket_name, obj.object_name)
-                logger.info(f"🗑️ Deleted '{obj.object_name}' from bucket '{self.bucket_name}'.")
-                deleted_any = True
-
-            if not deleted_any:
+            objects_to_delete = [
+                DeleteObject(obj.object_name)
+                for obj in self.client.list_objects(self.bucket_name, prefix=f"{document_uid}/", recursive=True)
+            ]
+            if not objects_to_delete:
                 logger.warning(f"⚠️ No objects found to delete for document {document_uid}.")
+                return
+
+            # remove_objects is lazy: errors are only reported once the iterator is drained
+            errors = list(self.client.remove_objects(self.bucket_name, objects_to_delete))
 
         except S3Error as e:
             logger.error(f"❌ Failed to delete objects for document {document_uid}: {e}")
             raise ValueError(f"Failed to delete document content from MinIO: {e}")
 
+        if errors:
+            for error in errors:
+                logger.error(f"❌ Failed to delete '{error.name}' for document {document_uid}: {error}")
+            raise ValueError(f"Failed to delete document content from MinIO: {len(errors)} object(s) could not be removed")
+        logger.info(f"🗑️ Deleted {len(objects_to_delete)} object(s) for document {document_uid} from bucket '{self.bucket_name}'.")
 
     def get_content(self, document_uid: str) -> BinaryIO:
         """
         Returns a binary stream of the first file found in the input/ folder for the document.
+        The object is streamed from MinIO as the caller reads it; closing the stream
+        releases the underlying connection.
         """
-        prefix = f"{document_uid}/input/"
         try:
-            objects = list(self.client.list_objects(self.bucket_name, prefix=prefix, recursive=True))
-            if not objects:
-                raise FileNotFoundError(f"No input content found for document: {document_uid}")
-
-            obj = objects[0]
-            response = self.client.get_object(self.bucket_name, obj.object_name)
-            return BytesIO(response.read())
+            object_name = self._get_input_object_name(document_uid)
+            return ReleasingStream(self.client.get_object(self.bucket_name, object_name))
         except S3Error as e:
             logger.error(f"Error fetching content for {document_uid}: {e}")
             raise FileNotFoundError(f"Failed to retrieve original content: {e}")
@@ -101,10 +148,51 @@ class MinioContentStore(BaseContentStore):
         """
         Fetches the markdown content from 'output/output.md' in the document directory.
         """
+        with self._cache_lock:
+            markdown = self._markdown_cache.get(document_uid)
+        if markdown is not None:
+            return markdown
+
         object_name = f"{document_uid}/output/output.md"
         try:
             response = self.client.get_object(self.bucket_name, object_name)
-            return response.read().decode("utf-8")
         except S3Error as e:
             logger.error(f"Error fetching markdown for {document_uid}: {e}")
             raise FileNotFoundError(f"Markdown not found for document: {document_uid}")
+        try:
+            markdown = response.read().decode("utf-8")
+        finally:
+            # Return the connection to the shared pool
+            response.close()
+            response.release_conn()
+
+        with self._cache_lock:
+            try:
+                self._markdown_cache[document_uid] = markdown
+            except ValueError:
+                pass  # larger than the whole cache, just not cached
+        return markdown
+
+    def _get_input_object_name(self, document_uid: str) -> str:
+        """
+        Returns the name of the first object under the document's input/ prefix,
+        listing the bucket only on a cache miss.
+        """
+        with self._cache_lock:
+            object_name = self._input_object_cache.get(document_uid)
+        if object_name is not None:
+            return object_name
+
+        objects = self.client.list_objects(self.bucket_name, prefix=f"{document_uid}/input/", recursive=True)
+        obj = next(iter(objects), None)
+        if obj is None:
+            raise FileNotFoundError(f"No input content found for document: {document_uid}")
+
+        with self._cache_lock:
+            self._input_object_cache[document_uid] = obj.object_name
+        return obj.object_name
+
+    def _invalidate_cache(self, document_uid: str) -> None:
+        with self._cache_lock:
+            self._input_object_cache.pop(document_uid, None)
+            self._markdown_cache.pop(document_uid, None)
@@ -13,16 +13,40 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
 
 class BaseMetadataStore(ABC):
     @abstractmethod
-    def get_all_metadata(self, filters: dict) -> list:
+    def get_all_metadata(self, filters: dict, limit: Optional[int] = None) -> Iterable[dict]:
+        """
+        Return the metadata entries matching the given filters.
+
+        The result may be produced lazily: wrap it in list() when it has to be
+        materialized or iterated more than once.
+
+        :param filters: Dictionary of filters to apply.
+        :param limit: Maximum number of entries to return, or None for all of them.
+        """
         pass
 
     @abstractmethod
     def get_metadata_by_uid(self, document_uid: str) -> dict:
         pass
 
+    def uid_exists(self, document_uid: str) -> bool:
+        """
+        Tell whether metadata exists for a document. Backends that can answer without
+        fetching the whole entry override this default.
+        """
+        return bool(self.get_metadata_by_uid(document_uid))
+
+    def get_metadata_by_uids(self, document_uids: List[str]) -> Dict[str, dict]:
+        """
+        Retrieve several metadata entries, keyed by document UID. Backends able to
+        fetch them in a single request override this one-by-one default.
+        """
+        return {document_uid: self.get_metadata_by_uid(document_uid) for document_uid in document_uids}
+
     @abstractmethod
     def update_metadata_field(self, document_uid: str, field: str, value) -> dict:
         pass
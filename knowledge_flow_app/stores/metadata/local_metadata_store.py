@@ -12,32 +12,172 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import atexit
+import copy
+import itertools
+import logging
+import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from knowledge_flow_app.common.utils import json_dumps, json_loads
 from knowledge_flow_app.stores.metadata.base_metadata_store import BaseMetadataStore
 
-@staticmethod
-def _match_nested(item: dict, filter_dict: dict) -> bool:
+logger = logging.getLogger(__name__)
+
+# Changes are written back to disk this long after the first unsaved update
+FLUSH_DELAY_SECONDS = 0.5
+
+def _flatten_filters(filter_dict: dict, prefix: Tuple[str, ...] = ()) -> List[Tuple[Tuple[str, ...], str]]:
     """
-    Recursively match nested filters inside a dictionary.
+    Turn nested filters into (key path, expected value) pairs, e.g.
+    {"front_metadata": {"agent_name": "fred"}} -> [(("front_metadata", "agent_name"), "fred")].
     """
+    conditions = []
     for key, value in filter_dict.items():
         if isinstance(value, dict):
-            # Nested dict -> must go deeper
-            sub_item = item.get(key, {})
-            if not isinstance(sub_item, dict) or not _match_nested(sub_item, value):
-                return False
+            conditions.extend(_flatten_filters(value, prefix + (key,)))
         else:
-            # Final key: compare
-            if str(item.get(key)) != str(value):
+            conditions.append((prefix + (key,), str(value)))
+    return conditions
+
+
+def _compile_filters(filter_dict: dict) -> Callable[[dict], bool]:
+    """
+    Build a predicate matching items against (possibly nested) filters.
+    The filters are flattened once per query instead of being walked
+    recursively for every item.
+    """
+    conditions = [(keys[:-1], keys[-1], expected) for keys, expected in _flatten_filters(filter_dict)]
+
+    def predicate(item: dict) -> bool:
+        for parents, leaf, expected in conditions:
+            node = item
+            for key in parents:
+                # A missing parent behaves as an empty dict, a non-dict one never matches
+                node = node.get(key, {})
+                if not isinstance(node, dict):
+                    return False
+            if str(node.get(leaf)) != expected:
                 return False
-    return True
+        return True
+
+    return predicate
+
+class _MetadataFile:
+    """
+    In-memory copy of a metadata JSON file with write-behind flushing.
+
+    The parsed list is kept between calls and only reloaded when the file changes
+    on disk while there are no pending writes, together with an index from
+    'document_uid' to list position for constant-time lookups. Updates mark the copy dirty and
+    schedule a flush, so a burst of changes results in a single write. One
+    instance is shared by every store opened on the same path.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.data: Optional[List[Dict[str, Any]]] = None
+        self.index: Dict[str, int] = {}
+        self.dirty = False
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Return the cached list, (re)reading the file if needed. Call with the lock held.
+        """
+        if not self.dirty:
+            stamp = self._file_stamp()
+            if self.data is None or stamp != self._stamp:
+                self.set_data(json_loads(self.path.read_bytes()) if stamp else [])
+                self._stamp = stamp
+        return self.data
+
+    def set_data(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Replace the cached list and rebuild the UID index. Call with the lock held.
+        """
+        self.data = data
+        self.index = {}
+        for i, item in enumerate(data):
+            self.index.setdefault(item.get("document_uid"), i)  # first entry wins, as in a linear scan
+
+    def _fsync_dir(self) -> None:
+        """
+        Persist the rename itself. Directories cannot be opened this way on Windows.
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def mark_dirty(self) -> None:
+        """
+        Schedule a flush of the cached list. Call with the lock held.
+        """
+        self.dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(FLUSH_DELAY_SECONDS, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Write pending changes to disk through a temporary file so that readers
+        never see a partially written store. The file and the rename are fsynced,
+        so a crash leaves either the previous or the new store, never a truncated one.
+        """
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.dirty:
+                return
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(json_dumps(self.data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                self._fsync_dir()
+            except OSError as e:
+                logger.error(f"❌ Failed to write metadata store {self.path}: {e}")
+                raise
+            self.dirty = False
+            self._stamp = self._file_stamp()
+
+
+_metadata_files: Dict[Path, _MetadataFile] = {}
+_metadata_files_lock = threading.Lock()
+
+
+def _get_metadata_file(path: Path) -> _MetadataFile:
+    with _metadata_files_lock:
+        key = path.resolve()
+        if key not in _metadata_files:
+            _metadata_files[key] = _MetadataFile(key)
+        return _metadata_files[key]
+
 
 class LocalMetadataStore(BaseMetadataStore):
     """
     A simple file-based metadata store implementation that persists metadata in a local JSON file.
+    The file is written compactly; use `python -m json.tool <file>` to inspect it.
 
     This class is primarily designed for local development or lightweight deployments where 
     a full database is not required. It implements the BaseMetadataStore interface and stores 
@@ -53,8 +193,10 @@ class LocalMetadataStore(BaseMetadataStore):
         "date_added": "2024-04-25"
     }
 
-    Each method loads and saves the entire dataset from/to disk, so this implementation is not
-    optimized for large-scale or concurrent usage.
+    The dataset is kept in memory and written back to disk shortly after each change
+    (see FLUSH_DELAY_SECONDS), which assumes this process is the only writer of the file.
+    Call flush() to force pending changes to disk. Entries are copied on the way in and
+    out, so callers cannot change the in-memory dataset behind the store's back.
     """
 
     def __init__(self, json_path: Path):
@@ -67,26 +209,39 @@ class LocalMetadataStore(BaseMetadataStore):
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if not self.path.exists():
             self.path.write_text("[]")  # Initialize empty list if file doesn't exist
+        self._file = _get_metadata_file(self.path)
 
     def _load(self) -> List[Dict[str, Any]]:
         """
-        Load the full metadata list from the JSON file.
+        Return the in-memory metadata list, loading it from the JSON file if needed.
 
         :return: List of metadata dictionaries.
         """
-        if not self.path.exists():
-            return []
-        return json.loads(self.path.read_text())
+        return self._file.load()
 
     def _save(self, data: List[Dict[str, Any]]) -> None:
         """
-        Save the full metadata list to the JSON file.
+        Replace the in-memory metadata list and schedule it to be written to the JSON file.
 
         :param data: List of metadata dictionaries to persist.
         """
-        self.path.write_text(json.dumps(data, indent=2))
+        self._file.set_data(data)
+        self._file.mark_dirty()
 
-    def get_all_metadata(self, filters: dict) -> List[dict]:
+    def _find(self, document_uid: str) -> Optional[int]:
+        """
+        Return the position of a document in the metadata list, or None.
+        """
+        self._load()
+        return self._file.index.get(document_uid)
+
+    def flush(self) -> None:
+        """
+        Write any pending changes to the JSON file immediately.
+        """
+        self._file.flush()
+
+    def get_all_metadata(self, filters: dict, limit: Optional[int] = None) -> Iterator[dict]:
         """
             Return all metadata entries matching the given (possibly nested) filters.
             The filters are applied recursively to the metadata dictionaries.
@@ -95,11 +250,20 @@ class LocalMetadataStore(BaseMetadataStore):
                 {"frontend_metadata": {"agent_name": "fred"}}
             
             This will return all metadata entries where the agent name is "fred" and the document name is "example.md".
+            Entries are yielded lazily, so the scan stops as soon as `limit` entries matched.
         :param filters: Dictionary of filters to apply.
-        :return: List of metadata dictionaries that match the filters.
+        :param limit: Maximum number of entries to return, or None for all of them.
+        :return: Iterator over the metadata dictionaries that match the filters.
         """
-        all_data = self._load()
-        return [item for item in all_data if _match_nested(item, filters)]
+        # Iterate over a snapshot so the lock is not held while the caller consumes entries.
+        # Stored entries are never mutated in place, so copying them outside the lock is safe.
+        with self._file.lock:
+            all_data = list(self._load())
+        if filters:
+            predicate = _compile_filters(filters)
+            all_data = (item for item in all_data if predicate(item))
+        for item in itertools.islice(all_data, limit):
+            yield copy.deepcopy(item)
 
     def get_metadata_by_uid(self, document_uid: str) -> dict:
         """
@@ -108,11 +272,16 @@ class LocalMetadataStore(BaseMetadataStore):
         :param document_uid: Unique identifier for the document.
         :return: The matching metadata dictionary, or None if not found.
         """
-        all_data = self._load()
-        return next(
-            (item for item in all_data if item.get("document_uid") == document_uid),
-            None
-        )
+        with self._file.lock:
+            i = self._find(document_uid)
+            return None if i is None else copy.deepcopy(self._file.data[i])
+
+    def uid_exists(self, document_uid: str) -> bool:
+        """
+        Tell whether an entry exists for the given document UID.
+        """
+        with self._file.lock:
+            return self._find(document_uid) is not None
 
     def update_metadata_field(self, document_uid: str, field: str, value: Any) -> dict:
         """
@@ -124,12 +293,15 @@ class LocalMetadataStore(BaseMetadataStore):
         :return: The updated metadata dictionary.
         :raises ValueError: If no matching document is found.
         """
-        data = self._load()
-        for item in data:
-            if item.get("document_uid") == document_uid:
-                item[field] = value
-                self._save(data)
-                return item
+        with self._file.lock:
+            i = self._find(document_uid)
+            if i is not None:
+                # Replaced rather than mutated: get_all_metadata copies entries of its
+                # snapshot without holding the lock
+                item = {**self._file.data[i], field: copy.deepcopy(value)}
+                self._file.data[i] = item
+                self._file.mark_dirty()
+                return copy.deepcopy(item)
         raise ValueError(f"No document found with UID {document_uid}")
 
     def save_metadata(self, metadata: dict) -> None:
@@ -146,14 +318,15 @@ class LocalMetadataStore(BaseMetadataStore):
         if not document_uid:
             raise ValueError("Metadata must contain a 'document_uid' field.")
 
-        data = self._load()
-        for i, item in enumerate(data):
-            if item.get("document_uid") == document_uid:
-                data[i] = metadata  # Overwrite existing
-                break
-        else:
-            data.append(metadata)  # Add new entry
-        self._save(data)
+        metadata = copy.deepcopy(metadata)  # later changes by the caller must not leak into the cache
+        with self._file.lock:
+            i = self._find(document_uid)
+            if i is not None:
+                self._file.data[i] = metadata  # Overwrite existing
+            else:
+                self._file.index[document_uid] = len(self._file.data)
+                self._file.data.append(metadata)  # Add new entry
+            self._file.mark_dirty()
 
     def delete_metadata(self, metadata: dict) -> None:
         """
@@ -166,11 +339,10 @@ class LocalMetadataStore(BaseMetadataStore):
         if not document_uid:
             raise ValueError("Cannot delete metadata without 'document_uid'")
 
-        data = self._load()
-        original_len = len(data)
-        data = [item for item in data if item.get("document_uid") != document_uid]
-
-        if len(data) == original_len:
-            raise ValueError(f"No document found with UID {document_uid}")
+        with self._file.lock:
+            if self._find(document_uid) is None:
+                raise ValueError(f"No document found with UID {document_uid}")
 
-        self._save(data)
+            # Removal shifts later positions, so the list and its index are rebuilt
+            data = [item for item in self._file.data if item.get("document_uid") != document_uid]
+            self._save(data)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
+
 from knowledge_flow_app.application_context import ApplicationContext
 from knowledge_flow_app.config.metadata_store_local_settings import MetadataStoreLocalSettings
 from knowledge_flow_app.config.opensearch_settings import OpenSearchSettings
@@ -19,23 +21,30 @@ from knowledge_flow_app.common.utils import validate_settings_or_exit
 from pathlib import Path
 
 from knowledge_flow_app.stores.metadata.base_metadata_store import BaseMetadataStore
-from knowledge_flow_app.stores.metadata.local_metadata_store import LocalMetadataStore
-from knowledge_flow_app.stores.metadata.opensearch_metadata_store import OpenSearchMetadataStore
 
+@lru_cache(maxsize=1)
 def get_metadata_store() -> BaseMetadataStore:
     """
     Factory function to create a metadata store instance based on the configuration.
-    As of now, it supports local and OpenSearch metadata storage.
+    As of now, it supports local (JSON file), sqlite and OpenSearch metadata storage.
+    The store is created once and shared; see clear_metadata_store_cache().
     Returns:
         BaseMetadataStore: An instance of the metadata store.
     """
     # Get the metadata storage configuration from the application context
     config = ApplicationContext.get_instance().get_config().metadata_storage
 
+    # Backends are imported on demand so unused client libraries are never loaded
     if config.type == "local":
+        from knowledge_flow_app.stores.metadata.local_metadata_store import LocalMetadataStore
         settings = MetadataStoreLocalSettings()
         return LocalMetadataStore(Path(settings.root_path).expanduser())
+    elif config.type == "sqlite":
+        from knowledge_flow_app.stores.metadata.sqlite_metadata_store import SqliteMetadataStore
+        settings = MetadataStoreLocalSettings()
+        return SqliteMetadataStore(Path(settings.root_path).expanduser())
     elif config.type == "opensearch":
+        from knowledge_flow_app.stores.metadata.opensearch_metadata_store import OpenSearchMetadataStore
         settings = validate_settings_or_exit(OpenSearchSettings, "OpenSearch Settings")
         return OpenSearchMetadataStore(
             host=settings.opensearch_host,
@@ -44,7 +53,15 @@ def get_metadata_store() -> BaseMetadataStore:
             secure=settings.opensearch_secure,
             verify_certs=settings.opensearch_verify_certs,
             vector_index_name=settings.opensearch_vector_index,
-            metadata_index_name=settings.opensearch_metadata_index
+            metadata_index_name=settings.opensearch_metadata_index,
+            client_kwargs={"pool_maxsize": settings.opensearch_pool_maxsize}
         )
     else:   
         raise ValueError(f"Unsupported metadata storage backend: {config.type}")
+
+
+def clear_metadata_store_cache() -> None:
+    """
+    Forget the shared metadata store, e.g. after the configuration changed in tests.
+    """
+    get_metadata_store.cache_clear()
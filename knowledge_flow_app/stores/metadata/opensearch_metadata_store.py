@@ -12,15 +12,108 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import inspect
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from cachetools import TTLCache
 from opensearchpy import OpenSearch, RequestsHttpConnection, OpenSearchException
+from opensearchpy.exceptions import NotFoundError, SerializationError
+from opensearchpy.helpers import bulk
+from opensearchpy.serializer import JSONSerializer
 
+from knowledge_flow_app.common.utils import json_dumps, json_loads
 from knowledge_flow_app.stores.metadata.base_metadata_store import BaseMetadataStore
 
 logger = logging.getLogger(__name__)
 
+# Lookup caches are per process: writes from other replicas become visible after the TTL
+EXISTS_CACHE_SIZE = 10_000
+METADATA_CACHE_SIZE = 2_000
+# Documents fetched per search request when iterating over metadata
+METADATA_PAGE_SIZE = 500
+
+# Same shape as OpenSearch's dynamic mapping for strings, so it can be applied to
+# existing indices; the keyword subfield is what UID filters and sorts use.
+DOCUMENT_UID_MAPPING = {
+    "type": "text",
+    "fields": {
+        "keyword": {"type": "keyword", "ignore_above": 256, "eager_global_ordinals": True}
+    },
+}
+
+# Stored Painless script copying a metadata field to the chunks of a document. The field
+# name is a parameter, so the script is compiled once rather than once per field.
+VECTOR_UPDATE_SCRIPT_ID = "update_metadata_field"
+VECTOR_UPDATE_SCRIPT = {
+    "lang": "painless",
+    "source": "ctx._source.metadata[params.field] = params.value",
+}
+
+def _async_client_kwargs(kwargs: dict, connection_class) -> dict:
+    """
+    Adapt the sync client settings to AsyncOpenSearch with the given connection class.
+    AIOHttpConnection names its pool size maxsize, and both the async transport and the
+    connection silently swallow options they do not know, so only the options one of
+    them declares are kept; the others are dropped with a warning.
+    """
+    from opensearchpy import AsyncTransport
+
+    kwargs = dict(kwargs)
+    if "pool_maxsize" in kwargs:
+        kwargs["maxsize"] = kwargs.pop("pool_maxsize")
+    accepted = set()
+    for init in (AsyncTransport.__init__, connection_class.__init__):
+        accepted.update(
+            name for name, parameter in inspect.signature(init).parameters.items()
+            if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+        )
+    # The transport would hand pool_maxsize to the connection, which ignores it
+    accepted -= {"self", "pool_maxsize", "connection_class"}
+    dropped = sorted(set(kwargs) - accepted)
+    if dropped:
+        logger.warning(f"Options not supported by the async OpenSearch client are ignored: {dropped}")
+    return {name: value for name, value in kwargs.items() if name in accepted}
+
+
+class _OrjsonSerializer(JSONSerializer):
+    """
+    JSONSerializer using orjson to encode requests and decode responses. Values orjson
+    does not know are converted by JSONSerializer.default, as with the stdlib encoder.
+    """
+
+    def loads(self, s):
+        try:
+            return json_loads(s)
+        except ValueError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data):
+        # Bodies that are already serialized are sent as they are
+        if isinstance(data, str):
+            return data
+        try:
+            return json_dumps(data, default=self.default).decode("utf-8")
+        except TypeError as e:
+            raise SerializationError(data, e)
+
+
 class OpenSearchMetadataStore(BaseMetadataStore):
+    """
+    Metadata store backed by an OpenSearch index, one document per 'document_uid'.
+
+    Lookups are cached for a short time (see cache_ttl). Cached entries are deep-copied
+    on the way out, like LocalMetadataStore's, so callers cannot change them.
+
+    The document UID has a 'keyword' subfield with eager global ordinals, both in the
+    metadata index and as 'metadata.document_uid' in the vector index. Sorts and the
+    update/delete-by-query calls on the vector index use that subfield, so they are
+    served from precomputed ordinals.
+    """
 
     def __init__(self, 
                  host: str, 
@@ -29,46 +122,189 @@ class OpenSearchMetadataStore(BaseMetadataStore):
                  username: str = None,
                  password: str = None,
                  secure: bool = False,
-                 verify_certs: bool = False):
+                 verify_certs: bool = False,
+                 bulk_chunk_size: int = 500,
+                 bulk_max_chunk_bytes: int = 100 * 1024 * 1024,
+                 client_kwargs: Optional[dict] = None,
+                 cache_ttl: float = 30):
+        # Without pool_maxsize each concurrent request beyond the first opens a new
+        # (TLS) connection; http_compress gzips request bodies and asks for gzipped
+        # responses. client_kwargs overrides any of these defaults.
+        kwargs = {
+            "pool_maxsize": 32,
+            "http_compress": True,
+            "timeout": 30,
+            "max_retries": 3,
+            "retry_on_timeout": True,
+            "serializer": _OrjsonSerializer(),
+            **(client_kwargs or {}),
+        }
         self.client = OpenSearch(
             host,
             http_auth=(username, password),
             use_ssl=secure,
             verify_certs=verify_certs,
             connection_class=RequestsHttpConnection,
+            **kwargs,
+        )
+        # Same settings for the async client, created on first use (see _get_async_client)
+        self._async_client = None
+        self._async_client_args = dict(
+            hosts=[host],
+            http_auth=(username, password),
+            use_ssl=secure,
+            verify_certs=verify_certs,
+            **kwargs,
         )
         self.metadata_index_name = metadata_index_name
         self.vector_index_name = vector_index_name
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_max_chunk_bytes = bulk_max_chunk_bytes
+
+        # document_uid -> exists, and document_uid -> merged metadata
+        self._cache_lock = threading.RLock()
+        self._exists_cache = TTLCache(maxsize=EXISTS_CACHE_SIZE, ttl=cache_ttl)
+        self._metadata_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=cache_ttl)
+
+        # Active bulk_ingest() blocks and the refresh interval to restore after the last one
+        self._bulk_ingest_lock = threading.Lock()
+        self._bulk_ingest_depth = 0
+        self._saved_refresh_interval = None
 
         if not self.client.indices.exists(index=metadata_index_name):
-            self.client.indices.create(index=metadata_index_name)
+            self.client.indices.create(
+                index=metadata_index_name,
+                body={"mappings": {"properties": {"document_uid": DOCUMENT_UID_MAPPING}}}
+            )
             logger.info(f"Opensearch index '{metadata_index_name}' created.")
         else:
             logger.warning(f"Opensearch index '{metadata_index_name}' already exists.")
+            self._put_uid_mapping(metadata_index_name, {"document_uid": DOCUMENT_UID_MAPPING})
+        # The vector index is created by the vector store; only tune it if it exists
+        if self.client.indices.exists(index=vector_index_name):
+            self._put_uid_mapping(
+                vector_index_name,
+                {"metadata": {"properties": {"document_uid": DOCUMENT_UID_MAPPING}}}
+            )
+        self._put_vector_update_script()
 
+    def _put_uid_mapping(self, index_name: str, properties: dict) -> None:
+        """
+        Apply the document UID mapping to an existing index. This is idempotent, and an
+        index that maps the UID differently is left untouched.
+        """
+        try:
+            self.client.indices.put_mapping(index=index_name, body={"properties": properties})
+        except OpenSearchException as e:
+            logger.warning(f"Could not apply document UID mapping to index '{index_name}': {e}")
+
+
+    def _put_vector_update_script(self) -> None:
+        """
+        Store the script used by update_metadata_field. Storing it again with the same
+        source is a no-op, so every instance can do it at startup. When it cannot be
+        stored (e.g. missing cluster privileges) the same source is sent inline instead.
+        """
+        try:
+            self.client.put_script(id=VECTOR_UPDATE_SCRIPT_ID, body={"script": VECTOR_UPDATE_SCRIPT})
+            self._vector_update_script = {"id": VECTOR_UPDATE_SCRIPT_ID}
+        except OpenSearchException as e:
+            logger.warning(f"Could not store script '{VECTOR_UPDATE_SCRIPT_ID}', sending it inline: {e}")
+            self._vector_update_script = dict(VECTOR_UPDATE_SCRIPT)
+
+    @staticmethod
+    def _merge_front_metadata(source: dict) -> dict:
+        """
+        Flatten a stored document: front_metadata entries are merged into the main metadata.
+        The source comes straight from a parsed response, so it is updated in place
+        rather than copied into a new dict.
+        """
+        front_metadata = source.pop("front_metadata", None)
+        if front_metadata:
+            source.update(front_metadata)
+        return source
+
+    def _invalidate_cache(self, document_uid: str) -> None:
+        with self._cache_lock:
+            self._exists_cache.pop(document_uid, None)
+            self._metadata_cache.pop(document_uid, None)
 
     def get_metadata_by_uid(self, document_uid: str) -> dict:
         """Fetch metadata of a specific document by UID."""
+        with self._cache_lock:
+            cached = self._metadata_cache.get(document_uid)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         try:
             response = self.client.get(index=self.metadata_index_name, id=document_uid)
-            if response["found"]:
-                source = response["_source"]
-                # Extract and merge main metadata with front_metadata
-                front_metadata = source.pop("front_metadata", {})
-                combined_metadata = {**source, **front_metadata}
-                return combined_metadata
-            else:
-                return {}
+            combined_metadata = self._merge_front_metadata(response["_source"])
+        except NotFoundError:
+            # A miss is a regular answer: cache it like a hit
+            combined_metadata = {}
         except Exception as e:
             logger.error(f"Error while retrieving metadata for UID '{document_uid}': {e}")
             return {}
-        
+
+        with self._cache_lock:
+            self._metadata_cache[document_uid] = combined_metadata
+            self._exists_cache[document_uid] = bool(combined_metadata)
+        return copy.deepcopy(combined_metadata)
+
+    def get_metadata_by_uids(self, document_uids: List[str]) -> Dict[str, dict]:
+        """
+        Fetch the metadata of several documents with a single mget request.
+        UIDs that are cached are not requested; unknown UIDs map to an empty dict.
+        """
+        results: Dict[str, dict] = {}
+        with self._cache_lock:
+            for document_uid in document_uids:
+                cached = self._metadata_cache.get(document_uid)
+                if cached is not None:
+                    results[document_uid] = copy.deepcopy(cached)
+        missing = [document_uid for document_uid in dict.fromkeys(document_uids) if document_uid not in results]
+        if not missing:
+            return results
+
+        try:
+            response = self.client.mget(
+                index=self.metadata_index_name,
+                body={"ids": missing}
+            )
+        except Exception as e:
+            logger.error(f"Error while retrieving metadata for {len(missing)} UID(s): {e}")
+            results.update((document_uid, {}) for document_uid in missing)
+            return results
+
+        with self._cache_lock:
+            for doc in response["docs"]:
+                combined_metadata = self._merge_front_metadata(doc["_source"]) if doc.get("found") else {}
+                self._metadata_cache[doc["_id"]] = combined_metadata
+                self._exists_cache[doc["_id"]] = bool(combined_metadata)
+                results[doc["_id"]] = copy.deepcopy(combined_metadata)
+        return results
+
     def uid_exists(self, document_uid: str) -> bool:
+        with self._cache_lock:
+            cached = self._exists_cache.get(document_uid)
+        if cached is not None:
+            return cached
+
         try:
-            return self.client.exists(index=self.metadata_index_name, id=document_uid)
+            # HEAD request: no document body is read or sent back
+            exists = self.client.exists(
+                index=self.metadata_index_name,
+                id=document_uid,
+                _source=False,
+                stored_fields="_none_"
+            )
         except Exception as e:
             logger.error(f"Error while checking existence of UID '{document_uid}' in OpenSearch: {e}")
             return False
+
+        with self._cache_lock:
+            self._exists_cache[document_uid] = exists
+        return exists
         
     def write_metadata(self, document_uid: str, metadata: dict):
         """Write metadata to OpenSearch using the UID as document ID."""
@@ -78,14 +314,129 @@ class OpenSearchMetadataStore(BaseMetadataStore):
                 id=document_uid,
                 body=metadata
             )
+            self._invalidate_cache(document_uid)
             logger.info(f"Metadata written to index '{self.metadata_index_name}' for UID '{document_uid}'.")
             return response
         except OpenSearchException as e:
             logger.error(f"❌ Failed to write metadata with UID {document_uid}: {e}")
             raise ValueError(f"Failed to write metadata to Opensearch: {e}")
 
+    def write_metadata_bulk(self, documents: Iterable[dict]) -> int:
+        """
+        Write several metadata documents with the bulk API, using each 'document_uid'
+        as document ID. Documents are sent in chunks of `bulk_chunk_size`, so N documents
+        cost a few round-trips instead of N.
+
+        :return: Number of documents written.
+        :raises ValueError: If some documents could not be written.
+        """
+        written_uids = []
+
+        def actions():
+            for document in documents:
+                written_uids.append(document["document_uid"])
+                yield {
+                    "_op_type": "index",
+                    "_index": self.metadata_index_name,
+                    "_id": document["document_uid"],
+                    "_source": document,
+                }
+
+        try:
+            success, errors = bulk(
+                self.client,
+                actions(),
+                chunk_size=self.bulk_chunk_size,
+                max_chunk_bytes=self.bulk_max_chunk_bytes,
+                raise_on_error=False,
+                request_timeout=60,
+            )
+        except OpenSearchException as e:
+            logger.error(f"❌ Failed to bulk write metadata: {e}")
+            raise ValueError(f"Failed to write metadata to Opensearch: {e}")
+        finally:
+            for document_uid in written_uids:
+                self._invalidate_cache(document_uid)
+        if errors:
+            for error in errors:
+                logger.error(f"❌ Failed to write metadata: {error}")
+            raise ValueError(f"Failed to write {len(errors)} metadata document(s) to Opensearch")
+        logger.info(f"Metadata written to index '{self.metadata_index_name}' for {success} document(s).")
+        return success
  
+    @contextmanager
+    def bulk_ingest(self):
+        """
+        Disable periodic refreshes of the metadata index while writing a batch, then
+        restore the previous refresh interval and refresh once. This avoids creating
+        many small segments during large ingestions. Nested or concurrent blocks in
+        this process share the setting, which is restored when the last one exits.
+
+            with store.bulk_ingest():
+                store.write_metadata_bulk(documents)
+        """
+        with self._bulk_ingest_lock:
+            if self._bulk_ingest_depth == 0:
+                settings = self.client.indices.get_settings(
+                    index=self.metadata_index_name,
+                    name="index.refresh_interval",
+                    flat_settings=True
+                )
+                index_settings = settings.get(self.metadata_index_name, {}).get("settings", {})
+                # None resets the interval to the index default when it was not set explicitly.
+                # "-1" means another process (or one that crashed) is mid-ingestion: restoring
+                # it would leave refresh disabled for good, so the default is restored instead.
+                refresh_interval = index_settings.get("index.refresh_interval")
+                self._saved_refresh_interval = None if refresh_interval == "-1" else refresh_interval
+                self.client.indices.put_settings(
+                    index=self.metadata_index_name,
+                    body={"index": {"refresh_interval": "-1"}}
+                )
+                logger.info(f"Refresh disabled on index '{self.metadata_index_name}' for bulk ingestion.")
+            self._bulk_ingest_depth += 1
+        try:
+            yield self
+        finally:
+            with self._bulk_ingest_lock:
+                self._bulk_ingest_depth -= 1
+                if self._bulk_ingest_depth == 0:
+                    self.client.indices.put_settings(
+                        index=self.metadata_index_name,
+                        body={"index": {"refresh_interval": self._saved_refresh_interval}}
+                    )
+                    self.client.indices.refresh(index=self.metadata_index_name)
+                    logger.info(f"Refresh restored on index '{self.metadata_index_name}' after bulk ingestion.")
+
+    def _vector_update_body(self, document_uid: str, field: str, value: any) -> dict:
+        """
+        update_by_query body copying a metadata field to every chunk of a document
+        in the vector index, keeping it in sync with the metadata index.
+        """
+        # - The Painless script (stored, or inline as a fallback) sets
+        #   `ctx._source.metadata[params.field]` to `params.value`, matching the
+        #   structure in the vector index.
+        # - The script is executed in the context of each document being updated.
+        # - Field and value are both parameters, so the compiled script is reused for every call.
+        # - The `term` query on `metadata.document_uid.keyword` selects the chunks of the document.
+        return {
+            "script": {
+                **self._vector_update_script,
+                "params": {"field": field, "value": value}
+            },
+            "query": {
+                "term": {
+                    "metadata.document_uid.keyword": document_uid
+                }
+            }
+        }
+
     def update_metadata_field(self, document_uid: str, field: str, value: any):
+        """
+        Update a metadata field, then propagate it to the document's chunks in the
+        vector index. The metadata index is updated synchronously; the vector index
+        update runs as a background OpenSearch task whose id is returned under
+        'task_id' (see wait_for_task).
+        """
         try:
             # 1) Partial update of the document in the metadata index
             response_meta = self.client.update(
@@ -93,80 +444,176 @@ class OpenSearchMetadataStore(BaseMetadataStore):
                 id=document_uid,
                 body={"doc": {field: value}}
             )
+            self._invalidate_cache(document_uid)
             logger.info(f"[METADATA INDEX] Field '{field}' updated for UID '{document_uid}' => {value}")
             # 2) Update (in bulk) chunks in the "vector store" index
-            #    - The Painless script will set `ctx._source.metadata.<field>`
-            #      to the new value.
-            #    - This is done to ensure that the vector index is in sync with the metadata index.
-            #    - The field name is prefixed with "metadata." to match the structure in the vector index.
-            #    - The script is executed in the context of each document being updated.
-            #    - The `params.value` is passed to the script as a parameter.
-            #    - The `document_uid` is used to filter the documents to be updated.
-            #    - The `term` query is used to match the documents with the specified UID.
-            #    - The `update_by_query` API is used to update all matching documents in the vector index.
-            script_source = f"ctx._source.metadata.{field} = params.value"
-            query_body = {
-                "script": {
-                    "source": script_source,
-                    "lang": "painless",
-                    "params": {"value": value}
-                },
-                "query": {
-                    "term": {
-                        "metadata.document_uid": document_uid
-                    }
-                }
-            }
-
+            #    - The update runs as a task sliced across shards, so the caller does
+            #      not wait for every chunk to be rewritten.
             response_vector = self.client.update_by_query(
                 index=self.vector_index_name,
-                body=query_body
+                body=self._vector_update_body(document_uid, field, value),
+                wait_for_completion=False,
+                conflicts="proceed",
+                slices="auto"
             )
             logger.info(
-                f"[VECTOR INDEX] Field 'metadata.{field}' updated for "
-                f"all chunks with UID='{document_uid}' => {value}"
+                f"[VECTOR INDEX] Update of field 'metadata.{field}' started for "
+                f"all chunks with UID='{document_uid}' => {value} (task {response_vector['task']})"
             )
 
             return {
                 "metadata_index_response": response_meta,
-                "vector_index_response": response_vector
+                "task_id": response_vector["task"]
             }
         except Exception as e:
             logger.error(f"Error while updating field '{field}' for UID '{document_uid}': {e}")
             raise e
 
-    def get_all_metadata(self, filters_dict: dict):
+    def _get_async_client(self):
         """
-        Retrieve all document metadata from the index,
-        optionally filtered by provided parameters.
-        filters_dict is a dict like {"GBU": "TAS", "BU": "X", ...}
+        AsyncOpenSearch requires aiohttp, so it is only imported once an async method is used.
         """
+        if self._async_client is None:
+            from opensearchpy import AIOHttpConnection, AsyncOpenSearch
+            self._async_client = AsyncOpenSearch(
+                connection_class=AIOHttpConnection,
+                **_async_client_kwargs(self._async_client_args, AIOHttpConnection),
+            )
+        return self._async_client
+
+    async def awrite_metadata(self, document_uid: str, metadata: dict):
+        """Async variant of write_metadata, for callers running on an event loop."""
         try:
-            must_clauses = []
-            # For each parameter, build a term query
-            # Ex.: field_name="GBU", field_value="TAS"
-            for field_name, field_value in filters_dict.items():
-                clause = {
-                    "term": {f"front_metadata.{field_name}.keyword": field_value}
-                }
-                must_clauses.append(clause)
-
-            if not must_clauses:
-                # If no parameters were passed, do a match_all
-                # This will return all documents in the index
-                query = {"match_all": {}}
-            else:
-                # Combine all filters into a bool must
-                # This will return documents that match all the filters
-                query = {
-                    "bool": {
-                        "must": must_clauses
-                    }
+            response = await self._get_async_client().index(
+                index=self.metadata_index_name,
+                id=document_uid,
+                body=metadata
+            )
+            self._invalidate_cache(document_uid)
+            logger.info(f"Metadata written to index '{self.metadata_index_name}' for UID '{document_uid}'.")
+            return response
+        except OpenSearchException as e:
+            logger.error(f"❌ Failed to write metadata with UID {document_uid}: {e}")
+            raise ValueError(f"Failed to write metadata to Opensearch: {e}")
+
+    async def aget_metadata_by_uid(self, document_uid: str) -> dict:
+        """Async variant of get_metadata_by_uid, sharing its cache."""
+        with self._cache_lock:
+            cached = self._metadata_cache.get(document_uid)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        try:
+            response = await self._get_async_client().get(index=self.metadata_index_name, id=document_uid)
+            combined_metadata = self._merge_front_metadata(response["_source"])
+        except NotFoundError:
+            combined_metadata = {}
+        except Exception as e:
+            logger.error(f"Error while retrieving metadata for UID '{document_uid}': {e}")
+            return {}
+
+        with self._cache_lock:
+            self._metadata_cache[document_uid] = combined_metadata
+            self._exists_cache[document_uid] = bool(combined_metadata)
+        return copy.deepcopy(combined_metadata)
+
+    async def aupdate_metadata_field(self, document_uid: str, field: str, value: any):
+        """Async variant of update_metadata_field."""
+        client = self._get_async_client()
+        try:
+            response_meta = await client.update(
+                index=self.metadata_index_name,
+                id=document_uid,
+                body={"doc": {field: value}}
+            )
+            self._invalidate_cache(document_uid)
+            response_vector = await client.update_by_query(
+                index=self.vector_index_name,
+                body=self._vector_update_body(document_uid, field, value),
+                wait_for_completion=False,
+                conflicts="proceed",
+                slices="auto"
+            )
+            logger.info(f"Field '{field}' updated for UID '{document_uid}' => {value} (vector index task {response_vector['task']})")
+            return {
+                "metadata_index_response": response_meta,
+                "task_id": response_vector["task"]
+            }
+        except Exception as e:
+            logger.error(f"Error while updating field '{field}' for UID '{document_uid}': {e}")
+            raise e
+
+    async def aclose(self) -> None:
+        """Close the async client's connections, if it was ever used."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def wait_for_task(self, task_id: str, poll_interval: float = 0.5, timeout: Optional[float] = None) -> dict:
+        """
+        Poll an OpenSearch task, such as the one returned by update_metadata_field,
+        until it completes.
+
+        :return: The task status as returned by the tasks API.
+        :raises TimeoutError: If the task is still running after `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            task = self.client.tasks.get(task_id=task_id)
+            if task.get("completed"):
+                failures = task.get("response", {}).get("failures")
+                if failures:
+                    logger.error(f"Task '{task_id}' completed with failures: {failures}")
+                return task
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"OpenSearch task '{task_id}' did not complete within {timeout}s")
+            time.sleep(poll_interval)
+
+    def iter_all_metadata(self, filters_dict: dict, limit: Optional[int] = None,
+                          page_size: int = METADATA_PAGE_SIZE) -> Iterator[dict]:
+        """
+        Yield document metadata from the index, optionally filtered by provided parameters.
+        filters_dict is a dict like {"GBU": "TAS", "BU": "X", ...}
+
+        Results are paged with search_after on the document UID, so any number of
+        documents can be iterated while only one page is held in memory.
+
+        Filters are exact term matches on front_metadata.<field>.keyword. Mapping those
+        fields as keyword with eager_global_ordinals keeps repeated filters cheap.
+        """
+        filter_clauses = []
+        # For each parameter, build a term query
+        # Ex.: field_name="GBU", field_value="TAS"
+        for field_name, field_value in filters_dict.items():
+            clause = {
+                "term": {f"front_metadata.{field_name}.keyword": field_value}
+            }
+            filter_clauses.append(clause)
+
+        if not filter_clauses:
+            # If no parameters were passed, match all documents without scoring them
+            query = {"constant_score": {"filter": {"match_all": {}}}}
+        else:
+            # Combine all filters in filter context: exact matches only, so
+            # OpenSearch skips scoring and can cache the clauses
+            query = {
+                "bool": {
+                    "filter": filter_clauses
                 }
+            }
 
+        body = {
+            "query": query,
+            # A unique sort key lets each page start right after the previous one
+            "sort": [{"document_uid.keyword": "asc"}],
+            "track_scores": False,
+        }
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
             response = self.client.search(
                 index=self.metadata_index_name,
-                body={"query": query},
+                body={**body, "size": size},
                 _source=[
                     "document_name", 
                     "document_uid", 
@@ -174,21 +621,31 @@ class OpenSearchMetadataStore(BaseMetadataStore):
                     "retrievable", 
                     "front_metadata"
                 ],
-                size=1000
+                # Only the documents and their sort values are read; skip hit counting
+                # and drop _index, _id and _score from the response
+                filter_path="hits.hits._source,hits.hits.sort",
+                track_total_hits=False
             )
 
-            hits = response["hits"]["hits"]
+            # filter_path removes "hits" entirely when a page is empty
+            hits = response.get("hits", {}).get("hits", [])
             # Merge _source and front_metadata if we want a single object per doc
-            # This will create a list of documents with merged metadata
-            documents = []
             for h in hits:
-                src = h["_source"].copy()
-                front_metadata = src.pop("front_metadata", {})
-                merged = {**src, **front_metadata}
-                documents.append(merged)
+                yield self._merge_front_metadata(h["_source"])
 
-            return documents
+            if len(hits) < size:
+                return
+            if remaining is not None:
+                remaining -= len(hits)
+            body["search_after"] = hits[-1]["sort"]
 
+    def get_all_metadata(self, filters_dict: dict, limit: Optional[int] = None):
+        """
+        Retrieve all document metadata from the index as a list,
+        optionally filtered by provided parameters (see iter_all_metadata).
+        """
+        try:
+            return list(self.iter_all_metadata(filters_dict, limit=limit))
         except Exception as e:
             logger.error(f"Error while retrieving metadata: {e}")
             return []
@@ -202,13 +659,14 @@ class OpenSearchMetadataStore(BaseMetadataStore):
 
             # Delete from the metadata index
             self.client.delete(index=self.metadata_index_name, id=document_uid)
+            self._invalidate_cache(document_uid)
             logger.info(f"Metadata with UID '{document_uid}' deleted from index '{self.metadata_index_name}'.")
 
             # Delete from the vector index
             query_delete_document_vector_index = {
                 "query": {
-                    "match": {
-                        "metadata.document_uid": document_uid
+                    "term": {
+                        "metadata.document_uid.keyword": document_uid
                     }
                 }
             }
@@ -219,12 +677,16 @@ class OpenSearchMetadataStore(BaseMetadataStore):
             logger.error(f"Error while deleting metadata for UID '{metadata.get('document_uid', 'N/A')}': {e}")
             raise e
 
-    def save_metadata(self, metadata: dict):
+    def save_metadata(self, metadata: Union[dict, list[dict]]):
         """Save metadata in Opensearch
 
         Args:
-            metadata (dict): A dictionary containing metadatas
+            metadata (dict): A dictionary containing metadatas, or a list of them
+                to write in bulk
         """
+        if isinstance(metadata, list):
+            self.write_metadata_bulk(metadata)
+            return
         try:
             self.write_metadata(document_uid=metadata.get("document_uid"), metadata=metadata)
         except Exception as e:
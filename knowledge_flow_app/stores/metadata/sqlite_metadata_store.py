@@ -0,0 +1,211 @@
+# Copyright Thales 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from knowledge_flow_app.stores.metadata.base_metadata_store import BaseMetadataStore
+
+logger = logging.getLogger(__name__)
+
+# Stringify a JSON value the way Python's str() does, so filters behave like LocalMetadataStore
+_AS_TEXT = (
+    "CASE json_type(data, ?) WHEN 'true' THEN 'True' WHEN 'false' THEN 'False' WHEN 'null' THEN 'None' "
+    "ELSE CAST(json_extract(data, ?) AS TEXT) END"
+)
+
+# PRAGMA user_version once the LocalMetadataStore JSON file has been considered for import
+_JSON_IMPORTED = 1
+
+
+def _json_path(keys: List[str]) -> str:
+    """
+    Build a JSON1 path such as $."front_metadata"."agent_name". Keys are quoted
+    so that names containing dots or spaces are addressed literally.
+    """
+    return "$" + "".join("." + json.dumps(key) for key in keys)
+
+
+def _flatten_filters(filter_dict: dict, prefix: List[str] = None) -> List[Tuple[str, str]]:
+    """
+    Turn a nested filter dictionary into (json path, expected value) pairs.
+    """
+    prefix = prefix or []
+    conditions = []
+    for key, value in filter_dict.items():
+        if isinstance(value, dict):
+            conditions.extend(_flatten_filters(value, prefix + [key]))
+        else:
+            conditions.append((_json_path(prefix + [key]), str(value)))
+    return conditions
+
+
+class SqliteMetadataStore(BaseMetadataStore):
+    """
+    A file-based metadata store backed by a single sqlite database.
+
+    Like LocalMetadataStore it needs no external service, but each record is a row
+    keyed by its 'document_uid', so lookups and updates touch one row instead of
+    reloading and rewriting the whole dataset. Records are stored as JSON documents
+    and filtered with sqlite's JSON1 functions.
+
+    If the database is created next to an existing LocalMetadataStore JSON file,
+    its entries are imported once so switching backends keeps existing metadata.
+    The import is recorded in the database's user_version, so entries deleted
+    afterwards do not come back on the next start.
+    """
+
+    def __init__(self, json_path: Path):
+        """
+        Initialize the store. The database lives next to the JSON file used by
+        LocalMetadataStore, with a '.db' suffix.
+
+        :param json_path: Path to the local metadata JSON file.
+        """
+        self.path = json_path.with_suffix(".db")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # FastAPI runs sync endpoints in a thread pool: share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (document_uid TEXT PRIMARY KEY, data JSON NOT NULL)")
+
+        self._import_json(json_path)
+
+    def _import_json(self, json_path: Path) -> None:
+        """
+        Seed a new database with the records of a LocalMetadataStore JSON file. This
+        happens at most once per database, whether or not the JSON file exists yet.
+        """
+        with self._lock:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] >= _JSON_IMPORTED:
+                return
+            rows = []
+            if json_path.exists() and not self._conn.execute("SELECT 1 FROM meta LIMIT 1").fetchone():
+                records = json.loads(json_path.read_text() or "[]")
+                rows = [(item["document_uid"], json.dumps(item)) for item in records if item.get("document_uid")]
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO meta (document_uid, data) VALUES (?, ?)", rows)
+                self._conn.execute(f"PRAGMA user_version = {_JSON_IMPORTED}")
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if rows:
+            logger.info(f"📥 Imported {len(rows)} metadata entries from {json_path} into {self.path}")
+
+    def get_all_metadata(self, filters: dict, limit: Optional[int] = None) -> List[dict]:
+        """
+        Return all metadata entries matching the given (possibly nested) filters.
+        Nested keys are resolved with json_extract and compared as strings, e.g.
+
+            {"front_metadata": {"agent_name": "fred"}}
+
+        :param filters: Dictionary of filters to apply.
+        :param limit: Maximum number of entries to return, or None for all of them.
+        :return: List of metadata dictionaries that match the filters.
+        """
+        conditions = _flatten_filters(filters)
+        query = "SELECT data FROM meta"
+        params: List[Any] = []
+        if conditions:
+            query += " WHERE " + " AND ".join(f"{_AS_TEXT} = ?" for _ in conditions)
+            for path, value in conditions:
+                params.extend((path, path, value))
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def get_metadata_by_uid(self, document_uid: str) -> dict:
+        """
+        Retrieve a single metadata entry by its unique document UID.
+
+        :param document_uid: Unique identifier for the document.
+        :return: The matching metadata dictionary, or None if not found.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM meta WHERE document_uid = ?", (document_uid,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def uid_exists(self, document_uid: str) -> bool:
+        """
+        Tell whether an entry exists for the given document UID.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM meta WHERE document_uid = ?", (document_uid,)).fetchone()
+        return row is not None
+
+    def update_metadata_field(self, document_uid: str, field: str, value: Any) -> dict:
+        """
+        Update a single field in a metadata entry by its document UID.
+
+        :param document_uid: The UID of the document to update.
+        :param field: The field name to update.
+        :param value: The new value to assign.
+        :return: The updated metadata dictionary.
+        :raises ValueError: If no matching document is found.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE meta SET data = json_set(data, ?, json(?)) WHERE document_uid = ?",
+                (_json_path([field]), json.dumps(value), document_uid),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"No document found with UID {document_uid}")
+            row = self._conn.execute("SELECT data FROM meta WHERE document_uid = ?", (document_uid,)).fetchone()
+        return json.loads(row[0])
+
+    def save_metadata(self, metadata: dict) -> None:
+        """
+        Add or replace a full metadata entry in the store.
+
+        :param metadata: The full metadata dictionary.
+        :raises ValueError: If 'document_uid' is missing.
+        """
+        document_uid = metadata.get("document_uid")
+        if not document_uid:
+            raise ValueError("Metadata must contain a 'document_uid' field.")
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (document_uid, data) VALUES (?, ?)",
+                (document_uid, json.dumps(metadata)),
+            )
+
+    def delete_metadata(self, metadata: dict) -> None:
+        """
+        Delete a metadata entry from the store based on its 'document_uid'.
+
+        :param metadata: The metadata dictionary to delete. Must include 'document_uid'.
+        :raises ValueError: If 'document_uid' is missing or not found in the store.
+        """
+        document_uid = metadata.get("document_uid")
+        if not document_uid:
+            raise ValueError("Cannot delete metadata without 'document_uid'")
+
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM meta WHERE document_uid = ?", (document_uid,))
+        if cursor.rowcount == 0:
+            raise ValueError(f"No document found with UID {document_uid}")
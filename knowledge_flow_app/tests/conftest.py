@@ -15,15 +15,13 @@
 import pytest
 from knowledge_flow_app.application_context import ApplicationContext
 from knowledge_flow_app.common.structures import Configuration, ContentStorageConfig, EmbeddingConfig, MetadataStorageConfig, ProcessorConfig, VectorStorageConfig
+from knowledge_flow_app.stores.content.content_storage_factory import clear_content_store_cache
+from knowledge_flow_app.stores.metadata.metadata_storage_factory import clear_metadata_store_cache
 
-@pytest.fixture(scope="function", autouse=True)
-def app_context():
-    """Fixture to initialize (and reset) the ApplicationContext for tests."""
-
-    # 🧼 Force reset the singleton before initializing
-    ApplicationContext._instance = None
-
-    config = Configuration(
+@pytest.fixture(scope="session")
+def base_config():
+    """Test configuration, built once per test session."""
+    return Configuration(
         security={
             "enabled": False,
             "keycloak_url": "http://fake",
@@ -57,4 +55,14 @@ def app_context():
         ]
     )
 
-    ApplicationContext(config)
+@pytest.fixture(scope="function", autouse=True)
+def app_context(base_config):
+    """Fixture to initialize (and reset) the ApplicationContext for tests."""
+
+    # 🧼 Force reset the singleton before initializing
+    ApplicationContext._instance = None
+    # Stores are cached by their factories and must follow the new configuration
+    clear_content_store_cache()
+    clear_metadata_store_cache()
+
+    ApplicationContext(base_config)
@@ -0,0 +1,59 @@
+# Copyright Thales 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+
+from knowledge_flow_app.stores.content import local_content_store
+from knowledge_flow_app.stores.content.local_content_store import LocalStorageBackend
+
+def read_tree(root):
+    return {
+        str(path.relative_to(root)): path.read_text()
+        for path in sorted(root.rglob("*")) if path.is_file()
+    }
+
+
+def test_save_content_mirrors_changes(tmp_path):
+    document_dir = tmp_path / "document"
+    (document_dir / "input").mkdir(parents=True)
+    (document_dir / "output").mkdir()
+    (document_dir / "input" / "sample.docx").write_text("original")
+    (document_dir / "output" / "output.md").write_text("# v1")
+    (document_dir / "output" / "stale.md").write_text("removed later")
+    store = LocalStorageBackend(tmp_path / "store")
+
+    # 🧪 First save copies everything
+    store.save_content("uid", document_dir)
+    assert read_tree(tmp_path / "store" / "uid") == read_tree(document_dir)
+
+    # 🧪 Re-save after a change, a removal and an addition
+    (document_dir / "output" / "output.md").write_text("# version 2")
+    (document_dir / "output" / "stale.md").unlink()
+    (document_dir / "output" / "images").mkdir()
+    (document_dir / "output" / "images" / "figure.txt").write_text("new")
+    store.save_content("uid", document_dir)
+    assert read_tree(tmp_path / "store" / "uid") == read_tree(document_dir)
+    assert store.get_markdown("uid") == "# version 2"
+
+
+def test_copy_file_falls_back_when_copy_stops_early(tmp_path, monkeypatch):
+    src = tmp_path / "src.txt"
+    src.write_text("content that must not be truncated")
+    # Some filesystems report 0 bytes copied although data remains
+    monkeypatch.setattr(local_content_store.os, "copy_file_range", lambda *args: 0, raising=False)
+
+    local_content_store._copy_file(str(src), str(tmp_path / "dst.txt"))
+    assert (tmp_path / "dst.txt").read_text() == src.read_text()
+    assert os.stat(tmp_path / "dst.txt").st_mtime_ns == os.stat(src).st_mtime_ns
@@ -0,0 +1,69 @@
+# Copyright Thales 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from knowledge_flow_app.stores.metadata.local_metadata_store import LocalMetadataStore
+
+def test_local_metadata_store(tmp_path):
+    store = LocalMetadataStore(tmp_path / "metadata-store.json")
+    store.save_metadata({"document_uid": "a", "front_metadata": {"agent_name": "fred"}})
+    store.save_metadata({"document_uid": "b", "front_metadata": {"agent_name": "bob"}})
+
+    # 🧪 Lookups and nested filters
+    assert store.get_metadata_by_uid("a")["front_metadata"]["agent_name"] == "fred"
+    assert store.get_metadata_by_uid("missing") is None
+    assert [m["document_uid"] for m in store.get_all_metadata({"front_metadata": {"agent_name": "bob"}})] == ["b"]
+    assert len(list(store.get_all_metadata({}, limit=1))) == 1
+
+    # 🧪 Updates and deletes
+    assert store.update_metadata_field("a", "retrievable", False)["retrievable"] is False
+    store.delete_metadata({"document_uid": "b"})
+    with pytest.raises(ValueError):
+        store.delete_metadata({"document_uid": "b"})
+
+    # 🧪 Pending changes reach the file
+    store.flush()
+    on_disk = json.loads((tmp_path / "metadata-store.json").read_text())
+    assert on_disk == [{"document_uid": "a", "front_metadata": {"agent_name": "fred"}, "retrievable": False}]
+
+
+def test_local_metadata_store_returns_copies(tmp_path):
+    store = LocalMetadataStore(tmp_path / "metadata-store.json")
+    store.save_metadata({"document_uid": "a", "front_metadata": {"agent_name": "fred"}})
+
+    # 🧪 Mutating returned entries must not change the store
+    store.get_metadata_by_uid("a")["document_name"] = "a.xxx"
+    next(iter(store.get_all_metadata({})))["front_metadata"]["agent_name"] = "bob"
+    store.update_metadata_field("a", "retrievable", True)["document_name"] = "a.xxx"
+
+    store.flush()
+    expected = {"document_uid": "a", "front_metadata": {"agent_name": "fred"}, "retrievable": True}
+    assert store.get_metadata_by_uid("a") == expected
+    assert json.loads((tmp_path / "metadata-store.json").read_text()) == [expected]
+
+
+def test_local_metadata_store_updates_do_not_touch_snapshots(tmp_path):
+    store = LocalMetadataStore(tmp_path / "metadata-store.json")
+    store.save_metadata({"document_uid": "a"})
+    store.save_metadata({"document_uid": "b"})
+
+    # 🧪 An update made while entries are being listed does not change the listed entries
+    entries = store.get_all_metadata({})
+    first = next(entries)
+    store.update_metadata_field("b", "retrievable", False)
+    assert [first, *entries] == [{"document_uid": "a"}, {"document_uid": "b"}]
+    assert store.get_metadata_by_uid("b") == {"document_uid": "b", "retrievable": False}
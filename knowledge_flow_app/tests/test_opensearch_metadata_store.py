@@ -0,0 +1,171 @@
+# Copyright Thales 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from knowledge_flow_app.stores.metadata import opensearch_metadata_store
+from knowledge_flow_app.stores.metadata.opensearch_metadata_store import OpenSearchMetadataStore
+
+@pytest.fixture
+def store(monkeypatch):
+    """Store whose OpenSearch client is a mock, so no cluster is needed."""
+    monkeypatch.setattr(opensearch_metadata_store, "OpenSearch", MagicMock())
+    return OpenSearchMetadataStore("http://opensearch:9200", "metadata-index", "vector-index")
+
+
+def test_save_metadata_list_uses_bulk(store, monkeypatch):
+    sent = []
+
+    def fake_bulk(client, actions, **kwargs):
+        sent.extend(actions)
+        return len(sent), []
+
+    monkeypatch.setattr(opensearch_metadata_store, "bulk", fake_bulk)
+    store._metadata_cache["a"] = {"document_uid": "a", "stale": True}
+
+    # 🧪 A list is written with one bulk call, and written UIDs leave the cache
+    store.save_metadata([{"document_uid": "a"}, {"document_uid": "b"}])
+    assert [(action["_index"], action["_id"]) for action in sent] == [("metadata-index", "a"), ("metadata-index", "b")]
+    assert "a" not in store._metadata_cache
+    store.client.index.assert_not_called()
+
+    # 🧪 Per-document failures are reported
+    monkeypatch.setattr(opensearch_metadata_store, "bulk", lambda client, actions, **kwargs: (0, [{"index": {"_id": "a"}}]))
+    with pytest.raises(ValueError):
+        store.write_metadata_bulk([{"document_uid": "a"}])
+
+
+def test_get_metadata_by_uid_caches_hits_and_misses(store):
+    def fake_get(index, id):
+        if id == "missing":
+            raise opensearch_metadata_store.NotFoundError(404, "not_found", {"found": False})
+        return {"found": True, "_source": {"document_uid": id, "front_metadata": {"agent_name": "fred"}}}
+
+    store.client.get.side_effect = fake_get
+
+    # 🧪 front_metadata is merged, and the result is served from the cache afterwards
+    assert store.get_metadata_by_uid("a") == {"document_uid": "a", "agent_name": "fred"}
+    assert store.get_metadata_by_uid("a") == {"document_uid": "a", "agent_name": "fred"}
+    assert store.uid_exists("a")
+
+    # 🧪 A missing document is an empty result, cached as well
+    assert store.get_metadata_by_uid("missing") == {}
+    assert store.get_metadata_by_uid("missing") == {}
+    assert not store.uid_exists("missing")
+    assert store.client.get.call_count == 2
+    store.client.exists.assert_not_called()
+
+
+def test_cached_metadata_is_returned_as_copies(store):
+    store.client.get.return_value = {"found": True, "_source": {"document_uid": "a", "tags": ["x"]}}
+
+    # 🧪 Mutating nested values of a returned entry does not change the cache
+    store.get_metadata_by_uid("a")["tags"].append("leak")
+    store.get_metadata_by_uids(["a"])["a"]["tags"].append("leak")
+    assert store.get_metadata_by_uid("a") == {"document_uid": "a", "tags": ["x"]}
+
+
+def test_get_metadata_by_uids_uses_one_mget(store):
+    store._metadata_cache["cached"] = {"document_uid": "cached"}
+    store.client.mget.return_value = {"docs": [
+        {"_id": "a", "found": True, "_source": {"document_uid": "a", "front_metadata": {"agent_name": "fred"}}},
+        {"_id": "missing", "found": False},
+    ]}
+
+    # 🧪 Cached UIDs are not requested, duplicates are requested once, misses map to {}
+    assert store.get_metadata_by_uids(["cached", "a", "missing", "a"]) == {
+        "cached": {"document_uid": "cached"},
+        "a": {"document_uid": "a", "agent_name": "fred"},
+        "missing": {},
+    }
+    store.client.mget.assert_called_once_with(index="metadata-index", body={"ids": ["a", "missing"]})
+
+
+def test_update_metadata_field_returns_task_to_wait_for(store):
+    store.client.update_by_query.return_value = {"task": "node:1"}
+    store.client.tasks.get.side_effect = [
+        {"completed": False},
+        {"completed": True, "response": {"updated": 3, "failures": []}},
+    ]
+
+    # 🧪 The vector index update runs as a task, which can be awaited
+    task_id = store.update_metadata_field("a", "retrievable", False)["task_id"]
+    assert store.client.update_by_query.call_args.kwargs["wait_for_completion"] is False
+    assert store.wait_for_task(task_id, poll_interval=0)["response"]["updated"] == 3
+    assert store.client.tasks.get.call_count == 2
+
+    # 🧪 A task still running after the timeout raises
+    store.client.tasks.get.side_effect = None
+    store.client.tasks.get.return_value = {"completed": False}
+    with pytest.raises(TimeoutError):
+        store.wait_for_task(task_id, poll_interval=0, timeout=0)
+
+
+def test_bulk_ingest_restores_refresh_interval(store):
+    store.client.indices.get_settings.return_value = {
+        "metadata-index": {"settings": {"index.refresh_interval": "5s"}}
+    }
+
+    # 🧪 Refresh is disabled once for nested blocks, then restored and run once
+    with store.bulk_ingest():
+        with store.bulk_ingest():
+            pass
+        store.client.indices.refresh.assert_not_called()
+    bodies = [call.kwargs["body"] for call in store.client.indices.put_settings.call_args_list]
+    assert bodies == [{"index": {"refresh_interval": "-1"}}, {"index": {"refresh_interval": "5s"}}]
+    store.client.indices.refresh.assert_called_once_with(index="metadata-index")
+
+    # 🧪 A refresh left disabled by another process is reset to the default, not kept disabled
+    store.client.indices.get_settings.return_value = {
+        "metadata-index": {"settings": {"index.refresh_interval": "-1"}}
+    }
+    with store.bulk_ingest():
+        pass
+    assert store.client.indices.put_settings.call_args.kwargs["body"] == {"index": {"refresh_interval": None}}
+
+
+def test_async_client_kwargs_follow_the_aiohttp_connection():
+    aiohttp_connection = pytest.importorskip("opensearchpy").AIOHttpConnection
+    kwargs = opensearch_metadata_store._async_client_kwargs(
+        {"hosts": ["http://opensearch:9200"], "pool_maxsize": 32, "http_compress": True,
+         "max_retries": 3, "pool_block": True},
+        aiohttp_connection,
+    )
+
+    # 🧪 The pool size is renamed, and options the async client would silently ignore are dropped
+    assert kwargs == {"hosts": ["http://opensearch:9200"], "maxsize": 32, "http_compress": True, "max_retries": 3}
+
+
+@pytest.mark.asyncio
+async def test_async_operations(store):
+    store._async_client = AsyncMock()
+    store._async_client.get.return_value = {"found": True, "_source": {"document_uid": "a", "front_metadata": {"agent_name": "fred"}}}
+    store._async_client.update_by_query.return_value = {"task": "node:1"}
+
+    # 🧪 Reads share the sync cache, writes evict from it
+    assert await store.aget_metadata_by_uid("a") == {"document_uid": "a", "agent_name": "fred"}
+    assert store.get_metadata_by_uid("a") == {"document_uid": "a", "agent_name": "fred"}
+    store.client.get.assert_not_called()
+    await store.awrite_metadata("a", {"document_uid": "a"})
+    assert "a" not in store._metadata_cache
+
+    # 🧪 Updates start the vector index task, and aclose releases the client
+    assert (await store.aupdate_metadata_field("a", "retrievable", False))["task_id"] == "node:1"
+    client = store._async_client
+    await store.aclose()
+    client.close.assert_awaited_once()
+    assert store._async_client is None
@@ -0,0 +1,58 @@
+# Copyright Thales 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+
+import pytest
+
+from knowledge_flow_app.stores.metadata.sqlite_metadata_store import SqliteMetadataStore
+
+def test_sqlite_metadata_store(tmp_path):
+    store = SqliteMetadataStore(tmp_path / "metadata-store.json")
+    store.save_metadata({"document_uid": "a", "retrievable": True, "front_metadata": {"agent_name": "fred"}})
+    store.save_metadata({"document_uid": "b", "retrievable": False, "tag": None, "front_metadata": {"agent_name": "bob"}})
+
+    # 🧪 Lookups, nested filters and filters on non-string values
+    assert store.get_metadata_by_uid("a")["front_metadata"]["agent_name"] == "fred"
+    assert store.get_metadata_by_uid("missing") is None
+    assert store.uid_exists("a") and not store.uid_exists("missing")
+    assert [m["document_uid"] for m in store.get_all_metadata({"front_metadata": {"agent_name": "bob"}})] == ["b"]
+    assert [m["document_uid"] for m in store.get_all_metadata({"retrievable": True})] == ["a"]
+    assert [m["document_uid"] for m in store.get_all_metadata({"retrievable": "False"})] == ["b"]
+    assert [m["document_uid"] for m in store.get_all_metadata({"tag": None})] == ["b"]
+    assert len(store.get_all_metadata({}, limit=1)) == 1
+
+    # 🧪 Updates and deletes
+    assert store.update_metadata_field("a", "retrievable", False)["retrievable"] is False
+    with pytest.raises(ValueError):
+        store.update_metadata_field("missing", "retrievable", False)
+    store.delete_metadata({"document_uid": "b"})
+    with pytest.raises(ValueError):
+        store.delete_metadata({"document_uid": "b"})
+    assert [m["document_uid"] for m in store.get_all_metadata({})] == ["a"]
+
+
+def test_sqlite_metadata_store_imports_json_once(tmp_path):
+    json_path = tmp_path / "metadata-store.json"
+    json_path.write_text(json.dumps([{"document_uid": "a"}, {"document_uid": "b"}]))
+
+    # 🧪 Existing JSON entries are imported into a new database
+    store = SqliteMetadataStore(json_path)
+    assert {m["document_uid"] for m in store.get_all_metadata({})} == {"a", "b"}
+
+    # 🧪 Deleted entries do not come back when the store is reopened
+    store.delete_metadata({"document_uid": "a"})
+    store.delete_metadata({"document_uid": "b"})
+    assert SqliteMetadataStore(json_path).get_all_metadata({}) == []